@@ -303,6 +303,7 @@ class ImprovedTopicWorker:
         """Stop the worker gracefully."""
         logger.info("🛑 Stopping ImprovedTopicWorker...")
         self.is_running = False
+        self.gemini_client.close()
         logger.info("✅ ImprovedTopicWorker stopped")
 
 
@@ -69,6 +69,8 @@ async def check_single_api_key(key_index: int, api_key: str) -> APIKeyStatus:
                 
         except Exception as e:
             raise e
+        finally:
+            temp_client.close()
             
     except Exception as e:
         error_str = str(e)
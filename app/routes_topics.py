@@ -94,13 +94,14 @@ def process_single_batch(batch, batch_num, all_topic_ids):
             f"Batch {batch_num + 1} started on {thread_name} with {len(batch)} topics"
         )
         
-        # Update status to processing for all topics in this batch
+        # Update status to processing for all topics in this batch, by
+        # topic_status_id where available (NO title cleaning needed!)
+        status_ids = [topic['topic_status_id'] for topic in batch if topic.get('topic_status_id')]
+        if status_ids:
+            db.update_topic_status_by_ids(status_ids, 'processing')
+            logger.debug("Updated topic_status_ids=%s to 'processing'", status_ids)
         for topic in batch:
-            # Use topic_status_id if available (NO title cleaning needed!)
-            if 'topic_status_id' in topic and topic['topic_status_id']:
-                db.update_topic_status_by_id(topic['topic_status_id'], 'processing')
-                logger.debug("Updated topic_status_id=%s to 'processing'", topic['topic_status_id'])
-            else:
+            if not topic.get('topic_status_id'):
                 # Fallback: use raw title (should rarely happen)
                 db.save_topic_status(topic['title'], 'processing', None)
         
@@ -175,6 +176,9 @@ def process_topics_background(topic_titles, batch_size=5):
         topics_to_process = []
         skipped_topics = []
         retry_topics = []
+        # Titles with no topic_status row yet; their rows are added in one
+        # go after the loop
+        new_titles = []
         
         # Get the next available ID to avoid conflicts
         next_id = db.get_next_available_id()
@@ -217,9 +221,7 @@ def process_topics_background(topic_titles, batch_size=5):
                     )
                     continue
             else:
-                # Create new topic_status entry
-                topic_status_id = db.add_topic_for_processing(title)
-                logger.info("Created new topic_status entry: %s (status_id=%s)", title, topic_status_id)
+                new_titles.append(title)
             
             # Use sequential IDs starting from next available ID
             topic_id = next_id + i
@@ -231,6 +233,16 @@ def process_topics_background(topic_titles, batch_size=5):
                 'created_at': datetime.now().isoformat()
             })
         
+        # Create the new topic_status entries; a title repeated in the input
+        # shares one entry
+        if new_titles:
+            new_titles = list(dict.fromkeys(new_titles))
+            new_status_ids = dict(zip(new_titles, db.add_topics_for_processing_bulk(new_titles)))
+            for topic in topics_to_process:
+                if topic['topic_status_id'] is None:
+                    topic['topic_status_id'] = new_status_ids[topic['title']]
+            logger.info("Created %s new topic_status entries", len(new_titles))
+        
         # Combine new topics and retry topics
         all_topics_to_process = topics_to_process + retry_topics
         logger.info(
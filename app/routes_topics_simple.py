@@ -197,6 +197,8 @@ def process_topics_background(topic_titles: List[str], batch_size: int):
                 processing_status["failed_topics"] += len(batch)
                 processing_status["errors"].append(f"Batch {batch_num} error: {str(e)}")
         
+        gemini_client.close()
+        
         # Mark processing as complete
         processing_status["is_processing"] = False
         processing_status["current_topic"] = None
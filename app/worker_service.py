@@ -3,49 +3,168 @@ Worker service for processing pending topics in the background.
 Uses a worker pool with capacity tracking to only process topics when workers are available.
 """
 import asyncio
+import atexit
+import itertools
 import logging
+import logging.handlers
 import os
+import queue
 import signal
 import sys
 import time
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 import threading
+from pathlib import Path
+from operator import itemgetter
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Only needed when run directly as a script (``python app/worker_service.py``);
+# ``run_worker.py`` and ``python -m app.worker_service`` already have the
+# project root on sys.path, so importers don't pay for the path lookup.
+if __name__ == "__main__":
+    _PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+    if _PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, _PROJECT_ROOT)
 
-from unified_database import UnifiedDatabase
+from unified_database import UnifiedDatabase, pending_topic_added
 from gemini_client import GeminiClient
 from batch_processor import TopicBatchProcessor
 from app.routes_topics import process_topics_background, processing_status, status_lock
 
 logger = logging.getLogger(__name__)
 
+_get_title = itemgetter('title')
+
+# Hot-path threads only enqueue log records; a background listener does the I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = None
+_queue_handler = None
+
+
+def _configure_logging():
+    """Install a QueueHandler on the root logger (no-op if already configured)."""
+    global _log_listener, _queue_handler
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    _queue_handler = logging.handlers.QueueHandler(_log_queue)
+    root.addHandler(_queue_handler)
+    root.setLevel(logging.INFO)
+    _log_listener = logging.handlers.QueueListener(_log_queue, stream_handler)
+    _log_listener.start()
+    atexit.register(_stop_logging)
+
+
+def _stop_logging():
+    """
+    Flush queued log records and stop the background listener.
+
+    The root logger goes back to writing through the stream handler directly,
+    so records logged after this (e.g. by later atexit hooks) still appear.
+    """
+    global _log_listener, _queue_handler
+    if _log_listener is not None:
+        _log_listener.stop()
+        root = logging.getLogger()
+        root.removeHandler(_queue_handler)
+        for handler in _log_listener.handlers:
+            root.addHandler(handler)
+        _log_listener = None
+        _queue_handler = None
+
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_configure_logging()
+
+
+# Each thread gets the next slot number the first time it touches a pool and
+# keeps it as its home shard index. Thread idents are aligned addresses, so
+# hashing them directly would put nearly every thread on shard 0.
+_thread_slot = threading.local()
+_next_thread_slot = itertools.count()
+
+
+def _current_thread_slot() -> int:
+    """Small sequential number identifying the calling thread."""
+    try:
+        return _thread_slot.value
+    except AttributeError:
+        _thread_slot.value = next(_next_thread_slot)
+        return _thread_slot.value
+
+
+class _PoolShard:
+    """One slice of the worker pool with its own lock and capacity counter."""
+
+    __slots__ = ('capacity', 'available', 'lock')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.available = capacity
+        self.lock = threading.Lock()
+
+    def take(self, count: int) -> int:
+        """Take up to ``count`` workers from this shard; returns how many were taken."""
+        with self.lock:
+            taken = min(count, self.available)
+            self.available -= taken
+            return taken
+
+    def give(self, count: int) -> int:
+        """Return up to ``count`` workers to this shard; returns how many were accepted."""
+        with self.lock:
+            given = min(count, self.capacity - self.available)
+            self.available += given
+            return given
 
 
 class WorkerPool:
-    """Worker pool with capacity tracking for efficient resource management."""
+    """
+    Worker pool with capacity tracking for efficient resource management.
+
+    Capacity is split across per-thread shards so concurrent submitters don't
+    contend on a single lock. A submitter draws from its thread's home shard
+    and only steals from other shards when that one runs dry.
+    """
     
-    def __init__(self, max_workers: int = 10):
+    def __init__(self, max_workers: int = 10, num_shards: Optional[int] = None):
         """
         Initialize the worker pool.
         
         Args:
             max_workers: Maximum number of concurrent workers
+            num_shards: Number of shards to split capacity across (defaults to CPU count)
         """
         self.max_workers = max_workers
-        self.active_workers = 0
-        self.available_workers = max_workers
-        self.lock = threading.Lock()
+        num_shards = num_shards or os.cpu_count() or 1
+        num_shards = max(1, min(num_shards, max_workers))
+        base, extra = divmod(max_workers, num_shards)
+        self._shards = [
+            _PoolShard(base + (1 if i < extra else 0)) for i in range(num_shards)
+        ]
         
-        logger.info(f"WorkerPool initialized with max_workers={max_workers}")
+        logger.info(f"WorkerPool initialized with max_workers={max_workers}, shards={num_shards}")
+    
+    @property
+    def available_workers(self) -> int:
+        """Number of workers currently free across all shards."""
+        return sum(shard.available for shard in self._shards)
+    
+    @property
+    def active_workers(self) -> int:
+        """Number of workers currently in use across all shards."""
+        return self.max_workers - self.available_workers
+    
+    def _shard_order(self) -> List[int]:
+        """Shard indices starting at the calling thread's home shard."""
+        num_shards = len(self._shards)
+        home = _current_thread_slot() % num_shards
+        return [(home + offset) % num_shards for offset in range(num_shards)]
     
     def can_accept_work(self, work_size: int = 1) -> bool:
         """
@@ -57,10 +176,9 @@ class WorkerPool:
         Returns:
             True if we can accept the work, False otherwise
         """
-        with self.lock:
-            return self.available_workers >= work_size
+        return self.available_workers >= work_size
     
-    def acquire_workers(self, count: int = 1) -> bool:
+    def acquire_workers(self, count: int = 1) -> Optional[Tuple[Tuple[int, int], ...]]:
         """
         Acquire workers for processing.
         
@@ -68,27 +186,50 @@ class WorkerPool:
             count: Number of workers to acquire
             
         Returns:
-            True if workers were acquired successfully, False otherwise
+            A truthy token of ``(shard_index, taken)`` pairs to pass back to
+            ``release_workers`` if the workers were acquired, None otherwise
         """
-        with self.lock:
-            if self.available_workers >= count:
-                self.available_workers -= count
-                self.active_workers += count
-                logger.debug(f"Acquired {count} workers. Available: {self.available_workers}, Active: {self.active_workers}")
-                return True
-            logger.debug(f"Could not acquire {count} workers. Available: {self.available_workers}")
-            return False
+        token = []
+        remaining = count
+        for index in self._shard_order():
+            taken = self._shards[index].take(remaining)
+            if taken:
+                token.append((index, taken))
+                remaining -= taken
+                if remaining == 0:
+                    break
+        
+        if remaining:
+            # Not enough capacity anywhere: put back what we took
+            for index, taken in token:
+                self._shards[index].give(taken)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Could not acquire {count} workers. Available: {self.available_workers}")
+            return None
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Acquired {count} workers. Available: {self.available_workers}, Active: {self.active_workers}")
+        return tuple(token) or ((self._shard_order()[0], 0),)
     
-    def release_workers(self, count: int = 1):
+    def release_workers(self, count: int = 1, token: Optional[Tuple[Tuple[int, int], ...]] = None):
         """
         Release workers after processing.
         
         Args:
             count: Number of workers to release
+            token: Token returned by ``acquire_workers``; when given, workers go
+                back to the shards they were taken from
         """
-        with self.lock:
-            self.active_workers -= count
-            self.available_workers += count
+        if token:
+            for index, taken in token:
+                self._shards[index].give(taken)
+        else:
+            remaining = count
+            for index in self._shard_order():
+                remaining -= self._shards[index].give(remaining)
+                if remaining == 0:
+                    break
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Released {count} workers. Available: {self.available_workers}, Active: {self.active_workers}")
     
     def get_status(self) -> Dict[str, int]:
@@ -98,13 +239,14 @@ class WorkerPool:
         Returns:
             Dictionary with worker pool statistics
         """
-        with self.lock:
-            return {
-                'max_workers': self.max_workers,
-                'active_workers': self.active_workers,
-                'available_workers': self.available_workers,
-                'utilization': (self.active_workers / self.max_workers) * 100 if self.max_workers > 0 else 0
-            }
+        available_workers = self.available_workers
+        active_workers = self.max_workers - available_workers
+        return {
+            'max_workers': self.max_workers,
+            'active_workers': active_workers,
+            'available_workers': available_workers,
+            'utilization': (active_workers / self.max_workers) * 100 if self.max_workers > 0 else 0
+        }
 
 
 class TopicWorker:
@@ -151,7 +293,7 @@ class TopicWorker:
             # Extract just the titles for process_topics_background
             # Note: The process_topics_background will re-fetch topic_status_id
             # using get_topic_status_by_title, so ID tracking is maintained
-            return [topic['title'] for topic in topics]
+            return list(map(_get_title, topics))
         except Exception as e:
             logger.exception(f"Error fetching pending topics: {e}")
             return []
@@ -181,7 +323,8 @@ class TopicWorker:
         required_workers = (len(pending_titles) + self.batch_size - 1) // self.batch_size
         
         # Try to acquire workers for this batch
-        if not self.worker_pool.acquire_workers(required_workers):
+        worker_token = self.worker_pool.acquire_workers(required_workers)
+        if not worker_token:
             logger.warning(f"Could not acquire {required_workers} workers, skipping this cycle")
             return
         
@@ -205,7 +348,7 @@ class TopicWorker:
             logger.exception(f"Error during processing: {e}")
         finally:
             # Always release workers
-            self.worker_pool.release_workers(required_workers)
+            self.worker_pool.release_workers(required_workers, worker_token)
             logger.info(f"Released {required_workers} workers")
     
     async def run(self):
@@ -222,21 +365,30 @@ class TopicWorker:
                 self.process_pending_topics()
                 
                 # Log worker pool status
-                status = self.worker_pool.get_status()
-                logger.debug(f"Worker pool status: {status['available_workers']}/{status['max_workers']} available, {status['utilization']:.1f}% utilization")
+                if logger.isEnabledFor(logging.DEBUG):
+                    status = self.worker_pool.get_status()
+                    logger.debug(f"Worker pool status: {status['available_workers']}/{status['max_workers']} available, {status['utilization']:.1f}% utilization")
+                    logger.debug(f"Waiting {self.poll_interval} seconds before next poll...")
                 
-                # Wait before next poll
-                logger.debug(f"Waiting {self.poll_interval} seconds before next poll...")
-                await asyncio.sleep(self.poll_interval)
+                # Wait until new pending topics are added in-process, falling
+                # back to the poll interval for inserts from other processes
+                await self._wait_for_pending()
                 
             except Exception as e:
                 logger.exception(f"Error in worker loop: {e}")
                 await asyncio.sleep(self.poll_interval)
     
+    async def _wait_for_pending(self):
+        """Sleep until a pending topic is added or the poll interval elapses."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, pending_topic_added.wait, self.poll_interval)
+        pending_topic_added.clear()
+    
     def stop(self):
         """Stop the worker gracefully."""
         logger.info("Stopping TopicWorker...")
         self.is_running = False
+        pending_topic_added.set()  # wake the poll wait so run() exits promptly
         logger.info("TopicWorker stopped")
 
 
@@ -245,6 +397,7 @@ def signal_handler(signum, frame):
     logger.info(f"Received signal {signum}, shutting down...")
     if worker:
         worker.stop()
+    # sys.exit runs the atexit hook that flushes and stops logging
     sys.exit(0)
 
 
@@ -9,35 +9,63 @@ import os
 import sys
 import logging
 from pathlib import Path
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import argparse
 import time
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from gemini_client import GeminiClient
 from database import TopicsDatabase
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_get_id = itemgetter('id')
+
 
 class TopicBatchProcessor:
     """Processes topics in batches using the Gemini client."""
     
-    def __init__(self, api_keys: List[str] = None, output_dir: str = "output", db_path: str = None):
+    def __init__(self, api_keys: List[str] = None, output_dir: str = "output", db_path: str = None,
+                 max_connections: int = 10):
         """Initialize the batch processor.
         
         Args:
             api_keys: List of Google AI API keys for rotation
             output_dir: Directory to save generated topic files (optional if using DB)
             db_path: Path to SQLite database (optional)
+            max_connections: Keep-alive connections to hold open to the Gemini API
+                (should match the number of batches processed in parallel)
         """
-        self.client = GeminiClient(api_keys)
+        # One pooled session for the lifetime of the processor so every batch
+        # reuses warm connections instead of paying a TLS handshake per call
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        )
+        self.client = GeminiClient(api_keys, session=self._session)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
         # Initialize database
         self.db = TopicsDatabase(db_path)
+    
+    def close(self):
+        """Close the Gemini client, the pooled HTTP session and the database connection."""
+        self.client.close()
+        self._session.close()
+        self.db.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def load_topics(self, topics_file: str) -> List[Dict[str, Any]]:
         """Load topics from a JSON file.
@@ -85,7 +113,7 @@ class TopicBatchProcessor:
         Returns:
             List of all topic IDs
         """
-        return [topic['id'] for topic in topics]
+        return list(map(_get_id, topics))
     
     def process_batch(self, topics_batch: List[Dict[str, Any]], 
                      all_topic_ids: List[int], 
@@ -193,24 +221,29 @@ class TopicBatchProcessor:
         logger.info(f"Loaded {len(topics)} topics from {topics_file}")
         logger.info(f"Processing in batches of {min(batch_size, 5)}")
         
-        # Set default dates
-        today = datetime.now().strftime("%Y-%m-%d")
+        # Set default dates (one clock read for both the dates and the batch id)
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
         created_date = created_date or today
         updated_date = updated_date or today
         
         # Process in batches
         successful_topics = []
         failed_topics = []
-        batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        batch_id = f"batch_{now.strftime('%Y%m%d_%H%M%S')}"
+        total_batches = (len(topics) + batch_size - 1) // batch_size
+        
+        # Bind hot-loop lookups once
+        process_batch = self.process_batch
+        save_topic = self.save_topic
         
         for i in range(0, len(topics), batch_size):
             batch = topics[i:i + batch_size]
             batch_num = (i // batch_size) + 1
-            total_batches = (len(topics) + batch_size - 1) // batch_size
             
-            logger.info(f"Processing batch {batch_num}/{total_batches}: {[t['id'] for t in batch]}")
+            logger.info(f"Processing batch {batch_num}/{total_batches}: {list(map(_get_id, batch))}")
             
-            generated_topics = self.process_batch(
+            generated_topics = process_batch(
                 batch, 
                 all_topic_ids, 
                 created_date, 
@@ -221,7 +254,7 @@ class TopicBatchProcessor:
             # Save successful topics
             for topic in generated_topics:
                 try:
-                    filepath = self.save_topic(topic, batch_id, save_to_file)
+                    filepath = save_topic(topic, batch_id, save_to_file)
                     successful_topics.append({
                         'id': topic['id'],
                         'title': topic['title'],
@@ -319,6 +352,7 @@ def main():
         logger.warning("Batch size limited to 5 by Gemini API")
         args.batch_size = 5
     
+    processor = None
     try:
         processor = TopicBatchProcessor(
             api_keys=args.api_keys,
@@ -361,6 +395,9 @@ def main():
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        if processor is not None:
+            processor.close()
 
 
 if __name__ == "__main__":
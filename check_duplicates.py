@@ -2,23 +2,248 @@
 """
 Script to check for duplicate titles in the database and optionally clean them up.
 """
+import atexit
 import sqlite3
-from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 
-try:
-    from tabulate import tabulate
-except ImportError:
-    # Simple fallback if tabulate is not installed
-    def tabulate(data, headers=None, tablefmt=None):
-        if headers:
-            print("\t".join(headers))
-            print("-" * 80)
-        for row in data:
-            print("\t".join(str(x) for x in row))
+
+def _plain_tabulate(data, headers=None, tablefmt=None):
+    """Simple fallback if tabulate is not installed."""
+    lines = []
+    if headers:
+        lines.append("\t".join(headers))
+        lines.append("-" * 80)
+    for row in data:
+        lines.append("\t".join(str(x) for x in row))
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def _get_tabulate():
+    """Import tabulate on first use so cleanup-only callers never load it."""
+    try:
+        from tabulate import tabulate
+    except ImportError:
+        return _plain_tabulate
+    return tabulate
+
+
+def tabulate(data, headers=None, tablefmt=None):
+    """Format rows as a table with tabulate (or the plain fallback)."""
+    return _get_tabulate()(data, headers=headers, tablefmt=tablefmt)
+
+DB_PATH = 'unified.db'
+
+# SQL is built once at import (one variant per topic_status schema) so the
+# text passed to execute() is identical across calls and hits the
+# connection's statement cache instead of being re-prepared.
+_TITLE_COLUMNS = ('original_title', 'title')
+
+
+def _truncated(expr, width):
+    """SQL expression cutting expr to width characters with a '...' marker."""
+    return (f"CASE WHEN length({expr}) > {width} "
+            f"THEN substr({expr}, 1, {width}) || '...' ELSE {expr} END")
+
+
+# Every row of the 20 most duplicated titles in one pass: the window columns
+# carry the per-title count and recency rank, replacing the GROUP_CONCAT
+# summary plus a follow-up query per title.
+_DUPLICATE_ROWS_SQL = {
+    title_column: f"""
+        SELECT 
+            {_truncated(title_column, 50)} as disp_title,
+            {_truncated(title_column, 30)} as detail_title,
+            {detail_current} as detail_current,
+            status,
+            {_truncated('error_message', error_width)} as detail_error,
+            created_at,
+            COUNT(*) OVER (PARTITION BY {title_column}) as duplicate_count,
+            ROW_NUMBER() OVER (
+                PARTITION BY {title_column} ORDER BY created_at DESC
+            ) as rn
+        FROM 
+            topic_status
+        WHERE 
+            {title_column} IN (
+                SELECT {title_column}
+                FROM topic_status
+                GROUP BY {title_column}
+                HAVING COUNT(*) > 1
+                ORDER BY COUNT(*) DESC, {title_column} ASC
+                LIMIT 20
+            )
+        ORDER BY 
+            duplicate_count DESC,
+            {title_column} ASC,
+            rn ASC
+    """
+    for title_column, detail_current, error_width in (
+        ('original_title',
+         f"COALESCE(NULLIF({_truncated('current_title', 30)}, ''), 'NULL')", 20),
+        ('title', 'NULL', 30),
+    )
+}
+
+# Rows shown in the detail view of the most duplicated title
+_DETAIL_ROWS = 10
+
+# Rows shown per table in the cleanup preview; the rest are only counted
+_PREVIEW_ROWS = 10
+
+# Batch size when draining result sets that are not capped by LIMIT
+_FETCH_SIZE = 1000
+
+# Covering indexes so the GROUP BY title scans walk an ordered index
+# instead of sorting the whole table in a temp B-tree
+_DUPLICATE_INDEXES = {
+    title_column: (
+        ('idx_topic_status_title_created',
+         f"CREATE INDEX IF NOT EXISTS idx_topic_status_title_created "
+         f"ON topic_status({title_column}, created_at DESC, status)"),
+        ('idx_topics_title_id',
+         "CREATE INDEX IF NOT EXISTS idx_topics_title_id ON topics(title, id)"),
+    )
+    for title_column in _TITLE_COLUMNS
+}
+
+_STATUS_SUMMARY_SQL = {
+    title_column: f"""
+        SELECT 
+            status,
+            COUNT(*) as total_duplicates
+        FROM (
+            SELECT {title_column}, status
+            FROM topic_status
+            WHERE {title_column} IN (
+                SELECT {title_column}
+                FROM topic_status
+                GROUP BY {title_column}
+                HAVING COUNT(*) > 1
+            )
+        )
+        GROUP BY status
+    """
+    for title_column in _TITLE_COLUMNS
+}
+
+_TOPIC_DUPLICATES_SQL = f"""
+    SELECT 
+        {_truncated('title', 50)} as disp_title,
+        COUNT(*) as duplicate_count
+    FROM 
+        topics
+    GROUP BY 
+        title
+    HAVING 
+        COUNT(*) > 1
+    ORDER BY 
+        duplicate_count DESC
+    LIMIT 10
+"""
+
+_STATUS_CLEANUP_PREVIEW_SQL = {
+    title_column: f"""
+        SELECT 
+            {_truncated('t1.' + title_column, 50)} as disp_title,
+            t1.status,
+            t1.created_at
+        FROM 
+            topic_status t1
+        WHERE 
+            t1.rowid NOT IN (
+                SELECT MAX(rowid)
+                FROM topic_status
+                GROUP BY {title_column}
+            )
+        ORDER BY 
+            t1.{title_column}, t1.created_at
+    """
+    for title_column in _TITLE_COLUMNS
+}
+
+_TOPICS_CLEANUP_PREVIEW_SQL = f"""
+    SELECT 
+        t1.id,
+        {_truncated('t1.title', 40)} as disp_title,
+        t1.created_date,
+        t1.source
+    FROM 
+        topics t1
+    WHERE 
+        t1.id NOT IN (
+            SELECT MAX(id)
+            FROM topics
+            GROUP BY title
+        )
+    ORDER BY 
+        t1.title, t1.id
+"""
+
+_STATUS_CLEANUP_DELETE_SQL = {
+    title_column: f"""
+        DELETE FROM topic_status 
+        WHERE rowid NOT IN (
+            SELECT MAX(rowid)
+            FROM topic_status
+            GROUP BY {title_column}
+        )
+    """
+    for title_column in _TITLE_COLUMNS
+}
+
+_TOPICS_CLEANUP_DELETE_SQL = """
+    DELETE FROM topics 
+    WHERE id NOT IN (
+        SELECT MAX(id)
+        FROM topics
+        GROUP BY title
+    )
+"""
+
+# Shared connection for the script's lifetime so the cleanup phase reuses the
+# page cache warmed by the check phase
+_conn = None
+
+
+def _get_conn():
+    """Return the shared connection, opening and tuning it on first use."""
+    global _conn
+    if _conn is None:
+        # Autocommit mode: transactions are opened explicitly (read snapshot in
+        # check_duplicates, BEGIN IMMEDIATE in cleanup_duplicates)
+        _conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256,
+                                isolation_level=None)
+        _conn.row_factory = sqlite3.Row
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.execute("PRAGMA temp_store=MEMORY")
+        _conn.execute("PRAGMA cache_size=-64000")
+        atexit.register(_close_conn)
+    return _conn
+
+
+def _close_conn():
+    """Close the shared connection if it was opened."""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+def _ensure_duplicate_indexes(cursor, title_column):
+    """Create the duplicate-scan indexes if missing and refresh planner stats."""
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    existing = {row[0] for row in cursor.fetchall()}
+    missing = [sql for name, sql in _DUPLICATE_INDEXES[title_column] if name not in existing]
+    if missing:
+        for sql in missing:
+            cursor.execute(sql)
+        cursor.execute("ANALYZE")
 
 def check_duplicates():
     """Check for duplicate titles in the database (schema-aware)."""
-    conn = sqlite3.connect('unified.db')
+    conn = _get_conn()
     cursor = conn.cursor()
     
     print("=" * 80)
@@ -37,162 +262,103 @@ def check_duplicates():
         print("\n📊 Schema: OLD (title)")
         title_column = 'title'
     
-    # 1. Check duplicates in topic_status table
-    print("\n1. Duplicate titles in topic_status table:")
-    print("-" * 50)
+    _ensure_duplicate_indexes(cursor, title_column)
     
-    cursor.execute(f"""
-        SELECT 
-            {title_column},
-            COUNT(*) as duplicate_count,
-            GROUP_CONCAT(status) as statuses,
-            GROUP_CONCAT(created_at) as created_dates
-        FROM 
-            topic_status
-        GROUP BY 
-            {title_column}
-        HAVING 
-            COUNT(*) > 1
-        ORDER BY 
-            duplicate_count DESC,
-            {title_column} ASC
-        LIMIT 20
-    """)
+    # The scan is read-only: run every query against one WAL snapshot
+    conn.execute("PRAGMA query_only=ON")
+    try:
+        conn.execute("BEGIN")
+        
+        # 1. Check duplicates in topic_status table
+        print("\n1. Duplicate titles in topic_status table:")
+        print("-" * 50)
     
-    duplicates = cursor.fetchall()
+        cursor.execute(_DUPLICATE_ROWS_SQL[title_column])
     
-    if duplicates:
-        headers = ["Title", "Count", "Statuses", "Created Dates"]
-        # Truncate long titles for display
-        display_data = []
-        for row in duplicates:
-            title = row[0][:50] + "..." if len(row[0]) > 50 else row[0]
-            display_data.append([title, row[1], row[2], row[3]])
-        
-        print(tabulate(display_data, headers=headers, tablefmt="grid"))
-        print(f"\nTotal duplicate titles found: {len(duplicates)}")
-    else:
-        print("No duplicates found in topic_status table!")
+        duplicates = []  # [title, count, statuses, created_dates] per title
+        details = []     # most recent rows of the most duplicated title
+        for row in cursor:
+            if row['rn'] == 1:
+                statuses, created_dates = [], []
+                duplicates.append([row['disp_title'], row['duplicate_count'], statuses, created_dates])
+            statuses.append(row['status'])
+            created_dates.append(row['created_at'])
+            if len(duplicates) == 1 and row['rn'] <= _DETAIL_ROWS:
+                details.append(row)
     
-    # 2. Show detailed info for top duplicates
-    if duplicates and len(duplicates) > 0:
-        print("\n2. Detailed view of most duplicated title:")
-        print("-" * 50)
-        
-        most_duplicated_title = duplicates[0][0]
-        
-        if has_original_title:
-            cursor.execute("""
-                SELECT 
-                    original_title,
-                    current_title,
-                    status,
-                    error_message,
-                    created_at
-                FROM 
-                    topic_status
-                WHERE 
-                    original_title = ?
-                ORDER BY 
-                    created_at DESC
-            """, (most_duplicated_title,))
-            
-            details = cursor.fetchall()
-            headers = ["Original Title", "Current Title", "Status", "Error", "Created At"]
-            display_data = []
-            for row in details:
-                orig = row[0][:30] + "..." if len(row[0]) > 30 else row[0]
-                curr = (row[1][:30] + "...") if row[1] and len(row[1]) > 30 else (row[1] or "NULL")
-                error = (row[3][:20] + "...") if row[3] and len(row[3]) > 20 else row[3]
-                display_data.append([orig, curr, row[2], error, row[4]])
+        # Oldest first, like GROUP_CONCAT over insertion order
+        for entry in duplicates:
+            entry[2] = ",".join(str(v) for v in reversed(entry[2]) if v is not None)
+            entry[3] = ",".join(str(v) for v in reversed(entry[3]) if v is not None)
+    
+        if duplicates:
+            headers = ["Title", "Count", "Statuses", "Created Dates"]
+            # Titles arrive already truncated for display
+            print(tabulate(duplicates, headers=headers, tablefmt="grid"))
+            print(f"\nTotal duplicate titles found: {len(duplicates)}")
         else:
-            cursor.execute("""
-                SELECT 
-                    title,
-                    status,
-                    error_message,
-                    created_at
-                FROM 
-                    topic_status
-                WHERE 
-                    title = ?
-                ORDER BY 
-                    created_at DESC
-            """, (most_duplicated_title,))
-            
-            details = cursor.fetchall()
-            headers = ["Title", "Status", "Error", "Created At"]
-            display_data = []
-            for row in details:
-                title = row[0][:30] + "..." if len(row[0]) > 30 else row[0]
-                error = (row[2][:30] + "...") if row[2] and len(row[2]) > 30 else row[2]
-                display_data.append([title, row[1], error, row[3]])
+            print("No duplicates found in topic_status table!")
+    
+        # 2. Show detailed info for top duplicates
+        if duplicates:
+            print("\n2. Detailed view of most duplicated title:")
+            print("-" * 50)
         
-        print(tabulate(display_data, headers=headers, tablefmt="grid"))
+            if has_original_title:
+                headers = ["Original Title", "Current Title", "Status", "Error", "Created At"]
+                display_data = [
+                    [r['detail_title'], r['detail_current'], r['status'], r['detail_error'], r['created_at']]
+                    for r in details
+                ]
+            else:
+                headers = ["Title", "Status", "Error", "Created At"]
+                display_data = [
+                    [r['detail_title'], r['status'], r['detail_error'], r['created_at']]
+                    for r in details
+                ]
+        
+            print(tabulate(display_data, headers=headers, tablefmt="grid"))
     
-    # 3. Summary by status
-    print("\n3. Duplicate summary by status:")
-    print("-" * 50)
+        # 3. Summary by status
+        print("\n3. Duplicate summary by status:")
+        print("-" * 50)
     
-    cursor.execute(f"""
-        SELECT 
-            status,
-            COUNT(*) as total_duplicates
-        FROM (
-            SELECT {title_column}, status
-            FROM topic_status
-            WHERE {title_column} IN (
-                SELECT {title_column}
-                FROM topic_status
-                GROUP BY {title_column}
-                HAVING COUNT(*) > 1
-            )
-        )
-        GROUP BY status
-    """)
+        cursor.execute(_STATUS_SUMMARY_SQL[title_column])
     
-    status_summary = cursor.fetchall()
-    if status_summary:
-        headers = ["Status", "Total Duplicate Entries"]
-        print(tabulate(status_summary, headers=headers, tablefmt="grid"))
+        display_data = []
+        while True:
+            rows = cursor.fetchmany(_FETCH_SIZE)
+            if not rows:
+                break
+            display_data.extend([r['status'], r['total_duplicates']] for r in rows)
+        if display_data:
+            headers = ["Status", "Total Duplicate Entries"]
+            print(tabulate(display_data, headers=headers, tablefmt="grid"))
     
-    # 4. Check for duplicates in topics table
-    print("\n4. Duplicate titles in topics table:")
-    print("-" * 50)
+        # 4. Check for duplicates in topics table
+        print("\n4. Duplicate titles in topics table:")
+        print("-" * 50)
     
-    cursor.execute("""
-        SELECT 
-            title,
-            COUNT(*) as duplicate_count
-        FROM 
-            topics
-        GROUP BY 
-            title
-        HAVING 
-            COUNT(*) > 1
-        ORDER BY 
-            duplicate_count DESC
-        LIMIT 10
-    """)
+        cursor.execute(_TOPIC_DUPLICATES_SQL)
     
-    topic_duplicates = cursor.fetchall()
+        display_data = [[r['disp_title'], r['duplicate_count']] for r in cursor]
     
-    if topic_duplicates:
-        headers = ["Title", "Count"]
-        display_data = []
-        for row in topic_duplicates:
-            title = row[0][:50] + "..." if len(row[0]) > 50 else row[0]
-            display_data.append([title, row[1]])
+        if display_data:
+            headers = ["Title", "Count"]
         
-        print(tabulate(display_data, headers=headers, tablefmt="grid"))
-    else:
-        print("No duplicates found in topics table!")
-    
-    conn.close()
+            print(tabulate(display_data, headers=headers, tablefmt="grid"))
+        else:
+            print("No duplicates found in topics table!")
+    finally:
+        # Nothing was written; also leaves the shared connection usable for
+        # cleanup_duplicates if the scan raised
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        conn.execute("PRAGMA query_only=OFF")
 
 def cleanup_duplicates(dry_run=True):
     """Clean up duplicate entries, keeping only the most recent one (schema-aware)."""
-    conn = sqlite3.connect('unified.db')
+    conn = _get_conn()
     cursor = conn.cursor()
     
     # Detect schema
@@ -201,6 +367,9 @@ def cleanup_duplicates(dry_run=True):
     has_original_title = 'original_title' in columns
     title_column = 'original_title' if has_original_title else 'title'
     
+    # The keep-set subqueries (MAX per title) walk these indexes
+    _ensure_duplicate_indexes(cursor, title_column)
+    
     if dry_run:
         print("\n" + "=" * 80)
         print("DRY RUN - CLEANUP SIMULATION (no data will be deleted)")
@@ -210,118 +379,86 @@ def cleanup_duplicates(dry_run=True):
         print("CLEANING UP DUPLICATES")
         print("=" * 80)
     
-    # 1. Clean up topic_status duplicates
+    if not dry_run:
+        # Both deletes run server-side in one transaction: one commit, no ID
+        # round-trips through Python. Auto-checkpointing is paused so the WAL
+        # is copied back once, after the commit, instead of mid-delete.
+        cursor.execute("PRAGMA wal_autocheckpoint=0")
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            print("\n1. Cleaning up topic_status table duplicates:")
+            print("-" * 50)
+            cursor.execute(_STATUS_CLEANUP_DELETE_SQL[title_column])
+            status_deleted = cursor.rowcount
+            print(f"Deleted {status_deleted} duplicate entries from topic_status!")
+            
+            print("\n2. Cleaning up topics table duplicates:")
+            print("-" * 50)
+            cursor.execute(_TOPICS_CLEANUP_DELETE_SQL)
+            topics_deleted = cursor.rowcount
+            print(f"Deleted {topics_deleted} duplicate entries from topics!")
+            
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.execute("PRAGMA wal_autocheckpoint=1000")
+        
+        # Fold the WAL back into the database and truncate it to zero bytes
+        cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        
+        print("\n" + "=" * 80)
+        print("CLEANUP SUMMARY")
+        print("=" * 80)
+        print(f"\nDeleted {status_deleted + topics_deleted} total duplicate entries:")
+        print(f"  - topic_status: {status_deleted} entries")
+        print(f"  - topics: {topics_deleted} entries")
+        print("\nCleanup completed successfully!")
+        return
+    
+    # 1. Preview topic_status duplicates
     print("\n1. Cleaning up topic_status table duplicates:")
     print("-" * 50)
     
     # Find duplicates that would be deleted from topic_status
-    cursor.execute(f"""
-        SELECT 
-            t1.{title_column},
-            t1.status,
-            t1.created_at
-        FROM 
-            topic_status t1
-        WHERE 
-            EXISTS (
-                SELECT 1
-                FROM topic_status t2
-                WHERE t1.{title_column} = t2.{title_column}
-                AND t1.rowid < t2.rowid
-            )
-        ORDER BY 
-            t1.{title_column}, t1.created_at
-    """)
+    cursor.execute(_STATUS_CLEANUP_PREVIEW_SQL[title_column])
     
-    status_to_delete = cursor.fetchall()
+    # Materialize only the rows shown; the remainder is streamed to count it
+    display_data = [
+        [r['disp_title'], r['status'], r['created_at']] for r in islice(cursor, _PREVIEW_ROWS)
+    ]
+    status_count = len(display_data) + sum(1 for _ in cursor)
     
-    if status_to_delete:
-        print(f"\nWould delete {len(status_to_delete)} duplicate entries from topic_status:")
+    if status_count:
+        print(f"\nWould delete {status_count} duplicate entries from topic_status:")
         headers = ["Title", "Status", "Created At"]
-        display_data = []
-        for row in status_to_delete[:10]:  # Show first 10
-            title = row[0][:50] + "..." if len(row[0]) > 50 else row[0]
-            display_data.append([title, row[1], row[2]])
-        
         print(tabulate(display_data, headers=headers, tablefmt="grid"))
         
-        if len(status_to_delete) > 10:
-            print(f"\n... and {len(status_to_delete) - 10} more entries")
-        
-        if not dry_run:
-            print("\nDeleting topic_status duplicates...")
-            cursor.execute(f"""
-                DELETE FROM topic_status 
-                WHERE rowid NOT IN (
-                    SELECT MAX(rowid)
-                    FROM topic_status
-                    GROUP BY {title_column}
-                )
-            """)
-            conn.commit()
-            print(f"Deleted {cursor.rowcount} duplicate entries from topic_status!")
+        if status_count > _PREVIEW_ROWS:
+            print(f"\n... and {status_count - _PREVIEW_ROWS} more entries")
     else:
         print("\nNo duplicates to clean up in topic_status!")
     
-    # 2. Clean up topics table duplicates
+    # 2. Preview topics table duplicates
     print("\n2. Cleaning up topics table duplicates:")
     print("-" * 50)
     
     # Find duplicates in topics table
-    cursor.execute("""
-        SELECT 
-            t1.id,
-            t1.title,
-            t1.created_date,
-            t1.source
-        FROM 
-            topics t1
-        WHERE 
-            EXISTS (
-                SELECT 1
-                FROM topics t2
-                WHERE t1.title = t2.title
-                AND t1.id < t2.id
-            )
-        ORDER BY 
-            t1.title, t1.id
-    """)
+    cursor.execute(_TOPICS_CLEANUP_PREVIEW_SQL)
     
-    topics_to_delete = cursor.fetchall()
+    display_data = [
+        [r['id'], r['disp_title'], r['created_date'], r['source']] for r in islice(cursor, _PREVIEW_ROWS)
+    ]
+    topics_count = len(display_data) + sum(1 for _ in cursor)
     
-    if topics_to_delete:
-        print(f"\nWould delete {len(topics_to_delete)} duplicate entries from topics:")
+    if topics_count:
+        print(f"\nWould delete {topics_count} duplicate entries from topics:")
         headers = ["ID", "Title", "Created Date", "Source"]
-        display_data = []
-        for row in topics_to_delete[:10]:  # Show first 10
-            title = row[1][:40] + "..." if len(row[1]) > 40 else row[1]
-            display_data.append([row[0], title, row[2], row[3]])
-        
         print(tabulate(display_data, headers=headers, tablefmt="grid"))
         
-        if len(topics_to_delete) > 10:
-            print(f"\n... and {len(topics_to_delete) - 10} more entries")
-        
-        if not dry_run:
-            # Collect IDs to delete
-            ids_to_delete = [row[0] for row in topics_to_delete]
-            
-            print("\nDeleting topics duplicates...")
-            # Delete in batches to avoid issues with large IN clauses
-            batch_size = 100
-            total_deleted = 0
-            
-            for i in range(0, len(ids_to_delete), batch_size):
-                batch_ids = ids_to_delete[i:i + batch_size]
-                placeholders = ','.join(['?' for _ in batch_ids])
-                cursor.execute(f"""
-                    DELETE FROM topics 
-                    WHERE id IN ({placeholders})
-                """, batch_ids)
-                total_deleted += cursor.rowcount
-            
-            conn.commit()
-            print(f"Deleted {total_deleted} duplicate entries from topics!")
+        if topics_count > _PREVIEW_ROWS:
+            print(f"\n... and {topics_count - _PREVIEW_ROWS} more entries")
     else:
         print("\nNo duplicates to clean up in topics!")
     
@@ -330,16 +467,11 @@ def cleanup_duplicates(dry_run=True):
     print("CLEANUP SUMMARY")
     print("=" * 80)
     
-    if dry_run:
-        total_would_delete = len(status_to_delete) + len(topics_to_delete)
-        print(f"\nDRY RUN - Would delete {total_would_delete} total duplicate entries:")
-        print(f"  - topic_status: {len(status_to_delete)} entries")
-        print(f"  - topics: {len(topics_to_delete)} entries")
-        print("\nRun with --cleanup to actually delete these duplicates.")
-    else:
-        print("\nCleanup completed successfully!")
-    
-    conn.close()
+    total_would_delete = status_count + topics_count
+    print(f"\nDRY RUN - Would delete {total_would_delete} total duplicate entries:")
+    print(f"  - topic_status: {status_count} entries")
+    print(f"  - topics: {topics_count} entries")
+    print("\nRun with --cleanup to actually delete these duplicates.")
 
 if __name__ == "__main__":
     import sys
@@ -3,23 +3,60 @@ Integration service to connect Topic Generator with Content Generator.
 """
 import requests
 import json
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds, so one hung service call cannot stall a batch
+REQUEST_TIMEOUT = (1, 30)
 
 
 class ContentIntegrationService:
     """Service to integrate topic generation with content generation."""
     
-    def __init__(self):
+    def __init__(self, max_connections: int = 32):
+        """
+        Args:
+            max_connections: Keep-alive connections to hold open per service
+        """
         self.topic_service_url = "http://localhost:5001"
         self.content_service_url = "http://localhost:8000"
+        
+        # One pooled session for both local services so repeated calls reuse
+        # keep-alive connections instead of opening a new socket each time
+        self._session = requests.Session()
+        self._session.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=max_connections,
+                max_retries=Retry(total=3, backoff_factor=0.1)
+            )
+        )
+    
+    def close(self):
+        """Close the pooled HTTP session."""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
-    def get_topics_for_content_generation(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get completed topics from the topic generator."""
+    def get_topics_for_content_generation(self, limit: int = 10,
+                                          ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """Get completed topics from the topic generator, optionally only the given IDs."""
+        params = {
+            'limit': limit,
+            'status': 'completed'
+        }
+        if ids:
+            params['ids'] = ','.join(map(str, ids))
         try:
-            response = requests.get(f"{self.topic_service_url}/api/topics", params={
-                'limit': limit,
-                'status': 'completed'
-            })
+            response = self._session.get(f"{self.topic_service_url}/api/topics", params=params,
+                                         timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             return response.json().get('topics', [])
         except Exception as e:
@@ -58,10 +95,11 @@ class ContentIntegrationService:
             }
             
             # Call content generation service
-            response = requests.post(
+            response = self._session.post(
                 f"{self.content_service_url}/api/content/generate-all",
                 json=content_request,
-                headers={"Content-Type": "application/json"}
+                headers={"Content-Type": "application/json"},
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             return response.json()
@@ -73,41 +111,54 @@ class ContentIntegrationService:
     def get_content_results(self, job_id: str) -> Dict[str, Any]:
         """Get results from content generation job."""
         try:
-            response = requests.get(f"{self.content_service_url}/api/results/{job_id}")
+            response = self._session.get(
+                f"{self.content_service_url}/api/results/{job_id}",
+                timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
             return response.json()
         except Exception as e:
             print(f"Error fetching content results: {e}")
             return {"error": str(e)}
     
-    def batch_generate_content(self, topic_ids: List[int], platforms: List[str]) -> List[Dict[str, Any]]:
-        """Generate content for multiple topics in batch."""
-        results = []
+    def batch_generate_content(self, topic_ids: List[int], platforms: List[str],
+                               max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Generate content for multiple topics in batch.
+        
+        The per-topic requests are I/O-bound and independent, so they run on a
+        thread pool (max_workers should not exceed the session pool size).
+        """
+        topic_ids = set(topic_ids)
         
-        # Get topics
-        topics = self.get_topics_for_content_generation(limit=len(topic_ids))
+        # Get only the requested topics; the membership check just guards
+        # against a topic service that ignores the ids filter
+        topics = self.get_topics_for_content_generation(limit=len(topic_ids), ids=sorted(topic_ids))
+        topics = [topic for topic in topics if topic['id'] in topic_ids]
         
-        for topic in topics:
-            if topic['id'] in topic_ids:
-                result = self.generate_content_for_topic(topic, platforms)
-                results.append({
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.generate_content_for_topic, topic, platforms)
+                for topic in topics
+            ]
+            return [
+                {
                     'topic_id': topic['id'],
                     'topic_name': topic['title'],
-                    'content_job': result
-                })
-        
-        return results
+                    'content_job': future.result()
+                }
+                for topic, future in zip(topics, futures)
+            ]
 
 
 # Example usage
 if __name__ == "__main__":
-    integration_service = ContentIntegrationService()
-    
     # Example: Generate content for topics with IDs 1, 2, 3
     topic_ids = [1, 2, 3]
     platforms = ["instagram:carousel", "x_twitter:thread", "youtube:long_form"]
     
-    results = integration_service.batch_generate_content(topic_ids, platforms)
+    with ContentIntegrationService() as integration_service:
+        results = integration_service.batch_generate_content(topic_ids, platforms)
     
     for result in results:
         print(f"Topic: {result['topic_name']}")
@@ -6,20 +6,290 @@ SQLite database manager for storing system design topics.
 import sqlite3
 import json
 import os
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Topic JSON columns go through orjson when it is installed (several times
+# faster than the stdlib for both directions), falling back to json.
+if orjson is not None:
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Optional MessagePack storage for the same columns, see
+# TopicsDatabase(msgpack_columns=True) and migrate_json_columns(). SQLite
+# hands BLOBs back as bytes and TEXT as str, so rows in either format can
+# be read from the same table.
+if msgspec is not None:
+    _msgpack_encode = msgspec.msgpack.Encoder().encode
+    _msgpack_decode = msgspec.msgpack.Decoder().decode
+else:
+    _msgpack_encode = None
+    _msgpack_decode = None
+
+
+def _load_column(value: Any) -> Any:
+    """Decode a topic JSON column stored as JSON text or a MessagePack BLOB."""
+    if isinstance(value, bytes):
+        if _msgpack_decode is None:
+            raise RuntimeError("Topic column is stored as MessagePack; install msgspec to read it")
+        return _msgpack_decode(value)
+    return _loads(value)
+
+
+_INSERT_TOPIC_SQL = """
+    INSERT OR REPLACE INTO topics (
+        id, title, description, category, subcategory, company,
+        technologies, complexity_level, tags, related_topics,
+        metrics, implementation_details, learning_objectives,
+        difficulty, estimated_read_time, prerequisites,
+        created_date, updated_date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Composite indexes matching get_topics_paginated's filter + ORDER BY
+# created_date, id pattern, so pages are read in index order and stop at
+# LIMIT. Columns are ascending (id is implied as the rowid) so the same
+# index is walked backwards for the default DESC order.
+_PAGINATION_INDEXES = (
+    ('idx_topics_created', "CREATE INDEX IF NOT EXISTS idx_topics_created ON topics(created_date, id)"),
+    ('idx_topics_cat_created', "CREATE INDEX IF NOT EXISTS idx_topics_cat_created ON topics(category, created_date)"),
+    ('idx_topics_company_created', "CREATE INDEX IF NOT EXISTS idx_topics_company_created ON topics(company, created_date)"),
+)
+
+# Makes the topic_status side of the LEFT JOIN an index-only lookup
+_STATUS_JOIN_INDEX = ('idx_topic_status_id_status',
+                      "CREATE INDEX IF NOT EXISTS idx_topic_status_id_status ON topic_status(id, status)")
+
+# title = ? lookups (get_topic_by_title, topic_exists and friends) otherwise
+# scan topics; the topic_status side of their join is a rowid probe
+_TITLE_INDEX = ('idx_topics_title', "CREATE INDEX IF NOT EXISTS idx_topics_title ON topics(title)")
+
+# External-content FTS5 index over the searchable topic text. The trigram
+# tokenizer matches arbitrary substrings, so MATCH keeps the old
+# LIKE '%term%' / Python `in` semantics for terms of at least three
+# characters. technologies is indexed as its stored JSON text.
+_FTS_COLUMNS = ('title', 'description', 'company', 'technologies')
+_TOPICS_FTS_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS topics_fts
+    USING fts5({', '.join(_FTS_COLUMNS)}, content='topics', content_rowid='id', tokenize='trigram')
+"""
+_FTS_INSERT = (f"INSERT INTO topics_fts(rowid, {', '.join(_FTS_COLUMNS)}) "
+               f"VALUES (new.id, {', '.join('new.' + c for c in _FTS_COLUMNS)});")
+_FTS_DELETE = (f"INSERT INTO topics_fts(topics_fts, rowid, {', '.join(_FTS_COLUMNS)}) "
+               f"VALUES ('delete', old.id, {', '.join('old.' + c for c in _FTS_COLUMNS)});")
+_TOPICS_FTS_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS topics_fts_ai AFTER INSERT ON topics BEGIN
+        {_FTS_INSERT}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS topics_fts_ad AFTER DELETE ON topics BEGIN
+        {_FTS_DELETE}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS topics_fts_au AFTER UPDATE OF {', '.join(_FTS_COLUMNS)} ON topics BEGIN
+        {_FTS_DELETE}
+        {_FTS_INSERT}
+    END
+    """,
+)
+_TRIGRAM_MIN_LENGTH = 3
+
+# get_detailed_stats reads pre-aggregated rows from stats_rollup. Any
+# change to topics or topic_status marks the roll-up dirty, and it is
+# rebuilt on the next read; max_age bounds how long the date-relative
+# daily window can go unrefreshed.
+_STATS_MAX_AGE = 60.0
+# On top of that, each TopicsDatabase keeps the last result in memory for
+# this many seconds, or until it commits a write itself
+_STATS_CACHE_TTL = 30.0
+_STATS_DIRTY_TRIGGERS = tuple(
+    f"""
+    CREATE TRIGGER IF NOT EXISTS stats_dirty_{table}_{suffix} AFTER {event} ON {table} BEGIN
+        UPDATE stats_meta SET dirty = 1 WHERE dirty = 0;
+    END
+    """
+    for table in ('topics', 'topic_status')
+    for suffix, event in (('ai', 'INSERT'), ('au', 'UPDATE'), ('ad', 'DELETE'))
+)
+# (kind, query returning (key, count) rows in display order). Queries are
+# run with a :since parameter, the start of the daily window as a UTC
+# 'YYYY-MM-DD HH:MM:SS' string; generated_at is stored in that format, so
+# the bound is a plain seek on idx_topics_generated_at and the day is its
+# first ten characters.
+_STATS_DAILY_WINDOW = timedelta(days=30)
+_STATS_QUERIES = (
+    ('status_breakdown', """
+        SELECT COALESCE(ts.status, 'completed') as status, COUNT(*) as count
+        FROM topics t
+        LEFT JOIN topic_status ts ON t.id = ts.id
+        GROUP BY COALESCE(ts.status, 'completed')
+    """),
+    ('category_breakdown', """
+        SELECT category, COUNT(*)
+        FROM topics
+        GROUP BY category
+        ORDER BY COUNT(*) DESC
+    """),
+    ('complexity_breakdown', """
+        SELECT complexity_level, COUNT(*)
+        FROM topics
+        GROUP BY complexity_level
+        ORDER BY COUNT(*) DESC
+    """),
+    ('daily_stats', """
+        SELECT substr(generated_at, 1, 10) as date, COUNT(*) as count
+        FROM topics
+        WHERE generated_at >= :since
+        GROUP BY date
+        ORDER BY date DESC
+    """),
+    ('company_breakdown', """
+        SELECT company, COUNT(*)
+        FROM topics
+        GROUP BY company
+        ORDER BY COUNT(*) DESC
+        LIMIT 10
+    """),
+)
+
+# topics columns in table order, and the ones stored as JSON text
+_TOPIC_COLUMNS = (
+    'id', 'title', 'description', 'category', 'subcategory', 'company',
+    'technologies', 'complexity_level', 'tags', 'related_topics', 'metrics',
+    'implementation_details', 'learning_objectives', 'difficulty',
+    'estimated_read_time', 'prerequisites', 'created_date', 'updated_date',
+    'generated_at',
+)
+_JSON_TOPIC_COLUMNS = frozenset({
+    'technologies', 'tags', 'related_topics', 'metrics',
+    'implementation_details', 'learning_objectives', 'prerequisites',
+})
+
+_LOG_SUCCESS_SQL = """
+    INSERT INTO processing_log (batch_id, topic_id, status)
+    VALUES (?, ?, 'success')
+"""
+
+_LOG_BATCH_SUCCESS_SQL = """
+    INSERT INTO processing_batch_log (batch_id, status, topic_count)
+    VALUES (?, 'success', ?)
+"""
+
+_SELECT_TOPIC_BY_ID_SQL = "SELECT * FROM topics WHERE id = ?"
+
+# ORDER BY clause for each allowed (sort_by, sort_order) pair of
+# get_topics_paginated; id breaks ties so OFFSET pages are stable
+_SORT_COLUMNS = {
+    'created_date': 't.created_date',
+    'title': 't.title',
+    'difficulty': 't.difficulty',
+    'company': 't.company',
+}
+_SORT = {
+    (sort_by, order): f"{column} {order.upper()}, t.id {order.upper()}"
+    for sort_by, column in _SORT_COLUMNS.items()
+    for order in ('asc', 'desc')
+}
+
+
+def _order_by(sort_by: str, sort_order: str) -> str:
+    """Look up the ORDER BY clause, defaulting unknown fields to created_date."""
+    order_by = _SORT.get((sort_by, sort_order))
+    if order_by is None:
+        # Unknown field or non-lowercase order; keep the requested direction
+        order = 'asc' if str(sort_order).lower() == 'asc' else 'desc'
+        order_by = _SORT.get((sort_by, order), _SORT[('created_date', order)])
+    return order_by
+
+
+# The listing queries differ only in which filters are present, so their
+# SQL is built once per filter combination (the tuple of WHERE conditions
+# from TopicsDatabase._filter_conditions) and reused from here after that.
+def _where_clause(conditions: Tuple[str, ...]) -> str:
+    return "WHERE " + " AND ".join(conditions) if conditions else ""
+
+
+@lru_cache(maxsize=128)
+def _topics_page_sql(conditions: Tuple[str, ...], order_by: str) -> str:
+    """SQL for a page of topics with statuses and the total match count."""
+    return f"""
+        SELECT t.*, ts.status as processing_status, ts.error_message,
+               COUNT(*) OVER () as total_count
+        FROM topics t
+        LEFT JOIN topic_status ts ON t.id = ts.id
+        {_where_clause(conditions)}
+        ORDER BY {order_by}
+        LIMIT ? OFFSET ?
+    """
+
+
+@lru_cache(maxsize=64)
+def _topics_after_sql(conditions: Tuple[str, ...]) -> str:
+    """SQL for a keyset page of topics, newest first."""
+    return f"""
+        SELECT t.*, ts.status as processing_status, ts.error_message
+        FROM topics t
+        LEFT JOIN topic_status ts ON t.id = ts.id
+        {_where_clause(conditions)}
+        ORDER BY t.created_date DESC, t.id DESC
+        LIMIT ?
+    """
+
+
+@lru_cache(maxsize=64)
+def _topics_count_sql(conditions: Tuple[str, ...]) -> str:
+    """SQL counting the topics that match the conditions."""
+    return f"""
+        SELECT COUNT(*)
+        FROM topics t
+        LEFT JOIN topic_status ts ON t.id = ts.id
+        {_where_clause(conditions)}
+    """
+
 
 class TopicsDatabase:
     """SQLite database manager for system design topics."""
     
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, msgpack_columns: bool = False,
+                 readers: int = 4):
         """Initialize the database manager.
         
         Args:
             db_path: Path to SQLite database file
+            readers: Number of read-only connections that serve queries
+                alongside the writer (0 sends reads through the writer)
+            msgpack_columns: Store the JSON columns of new topics as
+                MessagePack BLOBs (requires msgspec). Smaller and faster to
+                decode than JSON text; run migrate_json_columns() to convert
+                topics that are already stored.
         """
+        if msgpack_columns and msgspec is None:
+            raise ImportError("msgpack_columns=True requires the msgspec package")
+        self._dump_column = _msgpack_encode if msgpack_columns else _dumps
+        
         if db_path is None:
             try:
                 from config import DATABASE_PATH
@@ -28,11 +298,116 @@ class TopicsDatabase:
                 db_path = "topics.db"
         
         self.db_path = db_path
+        
+        # One writer connection for the instance's lifetime, shared across
+        # threads under a lock, so calls reuse its page and statement caches
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        self._write_count = 0
         self.init_database()
+        
+        # (write count, time.monotonic(), stats) of the last get_detailed_stats
+        self._stats_cache = None
+        self._stats_ttl = _STATS_CACHE_TTL
+        
+        # Read-only connections, opened once after the schema exists. With
+        # WAL they read concurrently with each other and with the writer.
+        # An in-memory database is private to its connection, so it can't
+        # have any.
+        self._readers = queue.Queue()
+        self._local = threading.local()
+        if self.db_path == ':memory:':
+            readers = 0
+        self._reader_count = readers
+        reader_uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+        for _ in range(readers):
+            conn = sqlite3.connect(reader_uri, uri=True, check_same_thread=False, cached_statements=256)
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+            conn.execute("PRAGMA cache_size=-64000")    # 64MB
+            self._readers.put(conn)
+    
+    @contextmanager
+    def _connection(self):
+        """Yield the shared connection under the lock.
+        
+        Like ``with sqlite3.connect(...) as conn``, the transaction is
+        committed on success and rolled back on error. Each commit bumps
+        _write_count, which invalidates the cached get_detailed_stats result.
+        """
+        with self._lock:
+            with self._conn:
+                yield self._conn
+            self._write_count += 1
+    
+    @contextmanager
+    def _read(self):
+        """Check out a read-only connection for the duration of a query.
+        
+        A thread that already holds one (a read method calling another)
+        gets the same connection back instead of waiting on the pool.
+        """
+        if not self._reader_count:
+            with self._lock, self._conn:
+                yield self._conn
+            return
+        
+        conn = getattr(self._local, 'reader', None)
+        if conn is not None:
+            yield conn
+            return
+        
+        conn = self._readers.get()
+        self._local.reader = conn
+        try:
+            yield conn
+        finally:
+            self._local.reader = None
+            self._readers.put(conn)
+    
+    def close(self):
+        """Close the writer and reader connections.
+        
+        The writer first runs PRAGMA optimize, which re-analyzes tables
+        whose planner statistics are missing or stale (the readers are
+        read-only and can't store them).
+        """
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA analysis_limit=400")
+                # 0x10000: consider every table, not only those this
+                # connection queried (SQLite 3.42+, ignored before)
+                self._conn.execute("PRAGMA optimize=0x10002")
+            except sqlite3.Error:
+                # Best effort, e.g. another process holds the write lock
+                pass
+            self._conn.close()
+        for _ in range(self._reader_count):
+            self._readers.get().close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def init_database(self):
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
+            # WAL lets readers run alongside a writer and, with
+            # synchronous=NORMAL, avoids an fsync per commit. journal_mode
+            # persists in the database file; the rest apply to the shared
+            # connection.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+            conn.execute("PRAGMA cache_size=-64000")    # 64MB
+            # INSERT OR REPLACE only fires the topics_fts delete trigger for
+            # the replaced row when recursive triggers are on
+            conn.execute("PRAGMA recursive_triggers=ON")
+            
             cursor = conn.cursor()
             
             # Create topics table
@@ -74,68 +449,128 @@ class TopicsDatabase:
                 )
             """)
             
+            # One row per batch instead of per saved topic; see save_topics_batch
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS processing_batch_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    batch_id TEXT NOT NULL,
+                    status TEXT NOT NULL,  -- 'success'
+                    topic_count INTEGER NOT NULL,
+                    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Create topic_status table for per-topic processing state
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS topic_status (
+                    id INTEGER PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    error_message TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Roll-up behind get_detailed_stats; starts dirty so the first
+            # read builds it
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS stats_rollup (
+                    kind TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    key TEXT,
+                    value INTEGER NOT NULL,
+                    PRIMARY KEY (kind, position)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS stats_meta (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    dirty INTEGER NOT NULL,
+                    refreshed_at REAL
+                )
+            """)
+            cursor.execute("INSERT OR IGNORE INTO stats_meta (id, dirty) VALUES (1, 1)")
+            for sql in _STATS_DIRTY_TRIGGERS:
+                cursor.execute(sql)
+            
             # Create indexes for better performance
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_topics_category ON topics(category)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_topics_company ON topics(company)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_topics_complexity ON topics(complexity_level)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_topics_difficulty ON topics(difficulty)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_topics_generated_at ON topics(generated_at)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_processing_log_batch ON processing_log(batch_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_processing_batch_log_batch ON processing_batch_log(batch_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_topic_status_status ON topic_status(status)")
+            
+            cursor.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'index')")
+            existing = {(row[0], row[1]) for row in cursor.fetchall()}
+            
+            try:
+                rebuild = ('table', 'topics_fts') not in existing
+                if not rebuild:
+                    cursor.execute("PRAGMA table_info(topics_fts)")
+                    if tuple(row[1] for row in cursor.fetchall()) != _FTS_COLUMNS:
+                        # Index from an older release with fewer columns
+                        for trigger in ('topics_fts_ai', 'topics_fts_ad', 'topics_fts_au'):
+                            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                        cursor.execute("DROP TABLE topics_fts")
+                        rebuild = True
+                cursor.execute(_TOPICS_FTS_SQL)
+                for sql in _TOPICS_FTS_TRIGGERS:
+                    cursor.execute(sql)
+                if not rebuild:
+                    # Other writers of unified.db that replaced rows without
+                    # recursive_triggers left stale entries behind; compare
+                    # the index with the topics table and rebuild on mismatch
+                    try:
+                        cursor.execute("INSERT INTO topics_fts(topics_fts, rank) VALUES ('integrity-check', 1)")
+                    except sqlite3.DatabaseError as e:
+                        if isinstance(e, sqlite3.OperationalError):
+                            raise
+                        rebuild = True
+                if rebuild:
+                    # Index topics saved before the FTS table existed
+                    cursor.execute("INSERT INTO topics_fts(topics_fts) VALUES ('rebuild')")
+                self._fts_enabled = True
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5 or the trigram tokenizer (< 3.34)
+                print(f"Topic search index unavailable, using LIKE: {e}")
+                self._fts_enabled = False
+            wanted = list(_PAGINATION_INDEXES) + [_STATUS_JOIN_INDEX, _TITLE_INDEX]
+            missing = [sql for name, sql in wanted if ('index', name) not in existing]
+            for sql in missing:
+                cursor.execute(sql)
+            if missing:
+                # Refresh planner statistics so the new indexes get picked
+                cursor.execute("ANALYZE")
             
             conn.commit()
     
-    def save_topic(self, topic: Dict[str, Any], batch_id: str = None) -> bool:
+    def save_topic(self, topic: Dict[str, Any], batch_id: str = None,
+                   log_success: bool = True) -> bool:
         """Save a single topic to the database.
         
         Args:
             topic: Topic dictionary to save
             batch_id: Optional batch identifier for tracking
+            log_success: Write a processing_log row for a successful save.
+                Failures are always logged when batch_id is given.
             
         Returns:
             True if saved successfully, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                # Prepare data for insertion
-                topic_data = (
-                    topic['id'],
-                    topic['title'],
-                    topic['description'],
-                    topic['category'],
-                    topic['subcategory'],
-                    topic['company'],
-                    json.dumps(topic['technologies']),
-                    topic['complexity_level'],
-                    json.dumps(topic['tags']),
-                    json.dumps(topic['related_topics']),
-                    json.dumps(topic['metrics']),
-                    json.dumps(topic['implementation_details']),
-                    json.dumps(topic['learning_objectives']),
-                    topic['difficulty'],
-                    topic['estimated_read_time'],
-                    json.dumps(topic['prerequisites']),
-                    topic['created_date'],
-                    topic['updated_date']
-                )
-                
                 # Insert or replace topic
-                cursor.execute("""
-                    INSERT OR REPLACE INTO topics (
-                        id, title, description, category, subcategory, company,
-                        technologies, complexity_level, tags, related_topics,
-                        metrics, implementation_details, learning_objectives,
-                        difficulty, estimated_read_time, prerequisites,
-                        created_date, updated_date
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, topic_data)
+                cursor.execute(_INSERT_TOPIC_SQL, self._topic_to_row(topic))
                 
                 # Log the processing
-                if batch_id:
-                    cursor.execute("""
-                        INSERT INTO processing_log (batch_id, topic_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (batch_id, topic['id']))
+                if batch_id and log_success:
+                    cursor.execute(_LOG_SUCCESS_SQL, (batch_id, topic['id']))
                 
                 conn.commit()
                 return True
@@ -144,7 +579,7 @@ class TopicsDatabase:
             # Log the error
             if batch_id:
                 try:
-                    with sqlite3.connect(self.db_path) as conn:
+                    with self._connection() as conn:
                         cursor = conn.cursor()
                         cursor.execute("""
                             INSERT INTO processing_log (batch_id, topic_id, status, error_message)
@@ -157,12 +592,41 @@ class TopicsDatabase:
             print(f"Error saving topic {topic.get('id', 'unknown')}: {e}")
             return False
     
-    def save_topics_batch(self, topics: List[Dict[str, Any]], batch_id: str = None) -> Dict[str, int]:
+    def _topic_to_row(self, topic: Dict[str, Any]) -> tuple:
+        """Convert a topic dictionary to an _INSERT_TOPIC_SQL parameter tuple."""
+        return (
+            topic['id'],
+            topic['title'],
+            topic['description'],
+            topic['category'],
+            topic['subcategory'],
+            topic['company'],
+            self._dump_column(topic['technologies']),
+            topic['complexity_level'],
+            self._dump_column(topic['tags']),
+            self._dump_column(topic['related_topics']),
+            self._dump_column(topic['metrics']),
+            self._dump_column(topic['implementation_details']),
+            self._dump_column(topic['learning_objectives']),
+            topic['difficulty'],
+            topic['estimated_read_time'],
+            self._dump_column(topic['prerequisites']),
+            topic['created_date'],
+            topic['updated_date']
+        )
+    
+    def save_topics_batch(self, topics: List[Dict[str, Any]], batch_id: str = None,
+                          log_each: bool = False) -> Dict[str, int]:
         """Save multiple topics to the database.
         
+        Successful saves are recorded as a single processing_batch_log row
+        with the batch's topic count. Failed topics still get their own
+        processing_log row with the error.
+        
         Args:
             topics: List of topic dictionaries
             batch_id: Optional batch identifier for tracking
+            log_each: Also write a processing_log row per successful topic
             
         Returns:
             Dictionary with success/failure counts
@@ -170,14 +634,44 @@ class TopicsDatabase:
         if not batch_id:
             batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
+        # Happy path: every row in one executemany and a single commit
+        try:
+            rows = [self._topic_to_row(topic) for topic in topics]
+        except (KeyError, TypeError, ValueError):
+            rows = None  # Malformed topic; let the per-topic path log which one
+        
+        if rows is not None:
+            try:
+                with self._connection() as conn:
+                    # Take the write lock before any work so a concurrent
+                    # writer makes us wait on busy_timeout up front rather
+                    # than failing partway through the batch
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.executemany(_INSERT_TOPIC_SQL, rows)
+                    if log_each:
+                        conn.executemany(_LOG_SUCCESS_SQL, [(batch_id, row[0]) for row in rows])
+                    else:
+                        conn.execute(_LOG_BATCH_SUCCESS_SQL, (batch_id, len(rows)))
+                return {'success': len(rows), 'failed': 0, 'skipped': 0}
+            except sqlite3.Error as e:
+                print(f"Batch insert failed, saving topics individually: {e}")
+        
+        # Fallback: save one by one so a bad topic only fails itself
         results = {'success': 0, 'failed': 0, 'skipped': 0}
         
         for topic in topics:
-            if self.save_topic(topic, batch_id):
+            if self.save_topic(topic, batch_id, log_success=log_each):
                 results['success'] += 1
             else:
                 results['failed'] += 1
         
+        if results['success'] and not log_each:
+            try:
+                with self._connection() as conn:
+                    conn.execute(_LOG_BATCH_SUCCESS_SQL, (batch_id, results['success']))
+            except sqlite3.Error as e:
+                print(f"Error logging batch {batch_id}: {e}")
+        
         return results
     
     def get_topic(self, topic_id: int) -> Optional[Dict[str, Any]]:
@@ -190,9 +684,9 @@ class TopicsDatabase:
             Topic dictionary or None if not found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM topics WHERE id = ?", (topic_id,))
+                cursor.execute(_SELECT_TOPIC_BY_ID_SQL, (topic_id,))
                 row = cursor.fetchone()
                 
                 if row:
@@ -213,16 +707,17 @@ class TopicsDatabase:
             True if deleted successfully, False if not found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
                 
-                # Check if topic exists
-                cursor.execute("SELECT id FROM topics WHERE id = ?", (topic_id,))
-                if not cursor.fetchone():
+                # RETURNING tells us whether the topic existed without a
+                # separate SELECT
+                cursor.execute("DELETE FROM topics WHERE id = ? RETURNING id", (topic_id,))
+                if cursor.fetchone() is None:
                     return False
                 
-                # Delete from all related tables
-                cursor.execute("DELETE FROM topics WHERE id = ?", (topic_id,))
+                # Delete from the related tables
                 cursor.execute("DELETE FROM processing_log WHERE topic_id = ?", (topic_id,))
                 cursor.execute("DELETE FROM topic_status WHERE id = ?", (topic_id,))
                 
@@ -233,47 +728,49 @@ class TopicsDatabase:
             print(f"Error deleting topic {topic_id}: {e}")
             return False
     
-    def get_topics_by_category(self, category: str) -> List[Dict[str, Any]]:
+    def get_topics_by_category(self, category: str,
+                               fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
         """Retrieve topics by category.
         
         Args:
             category: Category to filter by
+            fields: Optional topic keys to include (see _row_to_topic_dict)
             
         Returns:
             List of topic dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM topics WHERE category = ? ORDER BY id", (category,))
                 rows = cursor.fetchall()
                 
-                return [self._row_to_topic_dict(row) for row in rows]
+                return [self._row_to_topic_dict(row, fields) for row in rows]
                 
         except Exception as e:
             print(f"Error retrieving topics by category {category}: {e}")
             return []
     
-    def get_all_topics(self, limit: int = None) -> List[Dict[str, Any]]:
+    def get_all_topics(self, limit: int = None,
+                       fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
         """Retrieve all topics.
         
         Args:
             limit: Optional limit on number of topics
+            fields: Optional topic keys to include (see _row_to_topic_dict)
             
         Returns:
             List of topic dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
-                query = "SELECT * FROM topics ORDER BY id"
-                if limit:
-                    query += f" LIMIT {limit}"
-                
-                cursor.execute(query)
+                # One statement for every limit keeps it in the statement
+                # cache; SQLite treats LIMIT -1 as no limit
+                cursor.execute("SELECT * FROM topics ORDER BY id LIMIT ?", (limit if limit else -1,))
                 rows = cursor.fetchall()
                 
-                return [self._row_to_topic_dict(row) for row in rows]
+                return [self._row_to_topic_dict(row, fields) for row in rows]
                 
         except Exception as e:
             print(f"Error retrieving all topics: {e}")
@@ -286,7 +783,7 @@ class TopicsDatabase:
             Dictionary with various statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
                 # Total topics
@@ -311,11 +808,16 @@ class TopicsDatabase:
                 """)
                 by_complexity = dict(cursor.fetchall())
                 
-                # Recent processing
+                # Recent processing, from per-topic and per-batch log rows
                 cursor.execute("""
-                    SELECT COUNT(*) 
-                    FROM processing_log 
-                    WHERE processed_at >= datetime('now', '-24 hours')
+                    SELECT
+                        (SELECT COUNT(*) 
+                         FROM processing_log 
+                         WHERE processed_at >= datetime('now', '-24 hours'))
+                        +
+                        (SELECT COALESCE(SUM(topic_count), 0)
+                         FROM processing_batch_log
+                         WHERE processed_at >= datetime('now', '-24 hours'))
                 """)
                 recent_processing = cursor.fetchone()[0]
                 
@@ -330,8 +832,21 @@ class TopicsDatabase:
             print(f"Error getting stats: {e}")
             return {}
     
-    def _row_to_topic_dict(self, row) -> Dict[str, Any]:
-        """Convert database row to topic dictionary."""
+    def _row_to_topic_dict(self, row, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Convert database row to topic dictionary.
+        
+        Args:
+            row: topics row in table column order
+            fields: Optional keys to include. JSON columns left out are
+                never parsed, which is most of the cost for list views.
+        """
+        if fields is not None:
+            fields = set(fields)
+            return {
+                name: _load_column(value) if name in _JSON_TOPIC_COLUMNS else value
+                for name, value in zip(_TOPIC_COLUMNS, row)
+                if name in fields
+            }
         return {
             'id': row[0],
             'title': row[1],
@@ -339,16 +854,16 @@ class TopicsDatabase:
             'category': row[3],
             'subcategory': row[4],
             'company': row[5],
-            'technologies': json.loads(row[6]),
+            'technologies': _load_column(row[6]),
             'complexity_level': row[7],
-            'tags': json.loads(row[8]),
-            'related_topics': json.loads(row[9]),
-            'metrics': json.loads(row[10]),
-            'implementation_details': json.loads(row[11]),
-            'learning_objectives': json.loads(row[12]),
+            'tags': _load_column(row[8]),
+            'related_topics': _load_column(row[9]),
+            'metrics': _load_column(row[10]),
+            'implementation_details': _load_column(row[11]),
+            'learning_objectives': _load_column(row[12]),
             'difficulty': row[13],
             'estimated_read_time': row[14],
-            'prerequisites': json.loads(row[15]),
+            'prerequisites': _load_column(row[15]),
             'created_date': row[16],
             'updated_date': row[17],
             'generated_at': row[18]
@@ -366,10 +881,24 @@ class TopicsDatabase:
         if not output_file:
             output_file = f"topics_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        topics = self.get_all_topics()
-        
-        with open(output_file, 'w') as f:
-            json.dump(topics, f, indent=2)
+        # Stream one object per line straight from the cursor. The JSON
+        # columns are already stored as JSON text, so they are spliced in
+        # as-is rather than parsed into dicts and serialized again.
+        keys = [_dumps(name) + ':' for name in _TOPIC_COLUMNS]
+        with self._read() as conn, open(output_file, 'w', encoding='utf-8') as f:
+            f.write('[')
+            separator = '\n'
+            for row in conn.execute("SELECT * FROM topics ORDER BY id"):
+                values = []
+                for name, value in zip(_TOPIC_COLUMNS, row):
+                    if name not in _JSON_TOPIC_COLUMNS:
+                        value = _dumps(value)
+                    elif isinstance(value, bytes):
+                        value = _dumps(_load_column(value))
+                    values.append(value)
+                f.write(separator + '{' + ','.join(map(str.__add__, keys, values)) + '}')
+                separator = ',\n'
+            f.write('\n]\n' if separator != '\n' else ']\n')
         
         return output_file
     
@@ -386,21 +915,9 @@ class TopicsDatabase:
             True if saved successfully
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                # Create topic_status table if it doesn't exist
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS topic_status (
-                        id INTEGER PRIMARY KEY,
-                        title TEXT NOT NULL,
-                        status TEXT NOT NULL,
-                        error_message TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
                 # Insert or update status
                 cursor.execute("""
                     INSERT OR REPLACE INTO topic_status (id, title, status, error_message, updated_at)
@@ -424,7 +941,7 @@ class TopicsDatabase:
             Status dictionary or None
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM topic_status WHERE id = ?", (topic_id,))
                 row = cursor.fetchone()
@@ -447,9 +964,30 @@ class TopicsDatabase:
     def get_topics_paginated(self, offset: int = 0, limit: int = 20, 
                             search: str = '', category: str = '', status: str = '', 
                             complexity: str = '', company: str = '', 
-                            sort_by: str = 'created_date', sort_order: str = 'desc') -> List[Dict[str, Any]]:
+                            sort_by: str = 'created_date', sort_order: str = 'desc',
+                            fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
         """Get topics with pagination, search, and filtering.
         
+        See get_topics_page_with_count for the arguments.
+        
+        Returns:
+            List of topic dictionaries
+        """
+        topics, _ = self.get_topics_page_with_count(offset, limit, search, category, status,
+                                                    complexity, company, sort_by, sort_order, fields)
+        return topics
+    
+    def get_topics_page_with_count(self, offset: int = 0, limit: int = 20, 
+                                   search: str = '', category: str = '', status: str = '', 
+                                   complexity: str = '', company: str = '', 
+                                   sort_by: str = 'created_date',
+                                   sort_order: str = 'desc',
+                                   fields: Optional[Iterable[str]] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of topics and the total number of matches in one query.
+        
+        The total comes from COUNT(*) OVER () on the page query, so the
+        filters are evaluated once instead of again by get_topics_count.
+        
         Args:
             offset: Number of topics to skip
             limit: Maximum number of topics to return
@@ -460,64 +998,21 @@ class TopicsDatabase:
             company: Filter by company
             sort_by: Field to sort by (created_date, title, difficulty, company)
             sort_order: Sort order (asc, desc)
+            fields: Optional topic keys to include (see _row_to_topic_dict);
+                processing_status and error_message are always added
             
         Returns:
-            List of topic dictionaries
+            Tuple of (list of topic dictionaries, total matching topics)
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
                 # Build WHERE clause
-                where_conditions = []
-                params = []
-                
-                if search:
-                    where_conditions.append("t.title LIKE ?")
-                    params.append(f"%{search}%")
-                
-                if category:
-                    where_conditions.append("t.category = ?")
-                    params.append(category)
-                
-                if complexity:
-                    where_conditions.append("t.complexity_level = ?")
-                    params.append(complexity)
-                
-                if company:
-                    where_conditions.append("t.company = ?")
-                    params.append(company)
-                
-                if status:
-                    if status == 'completed':
-                        where_conditions.append("(ts.status = 'completed' OR ts.status IS NULL)")
-                    elif status == 'pending':
-                        where_conditions.append("ts.status = 'pending'")
-                    elif status == 'failed':
-                        where_conditions.append("ts.status = 'failed'")
-                
-                where_clause = ""
-                if where_conditions:
-                    where_clause = "WHERE " + " AND ".join(where_conditions)
-                
-                # Build ORDER BY clause
-                valid_sort_fields = {
-                    'created_date': 't.created_date',
-                    'title': 't.title',
-                    'difficulty': 't.difficulty',
-                    'company': 't.company'
-                }
-                sort_field = valid_sort_fields.get(sort_by, 't.created_date')
-                sort_direction = 'ASC' if sort_order.lower() == 'asc' else 'DESC'
+                where_conditions, params = self._filter_conditions(
+                    search, category, status, complexity, company)
                 
-                query = f"""
-                    SELECT t.*, ts.status as processing_status, ts.error_message
-                    FROM topics t
-                    LEFT JOIN topic_status ts ON t.id = ts.id
-                    {where_clause}
-                    ORDER BY {sort_field} {sort_direction}
-                    LIMIT ? OFFSET ?
-                """
+                query = _topics_page_sql(tuple(where_conditions), _order_by(sort_by, sort_order))
                 
                 params.extend([limit, offset])
                 cursor.execute(query, params)
@@ -525,21 +1020,29 @@ class TopicsDatabase:
                 
                 topics = []
                 for row in rows:
-                    topic = self._row_to_topic_dict(row[:19])  # First 19 columns are topic data
+                    topic = self._row_to_topic_dict(row[:19], fields)  # First 19 columns are topic data
                     topic['processing_status'] = row[19] if row[19] else 'completed'
                     topic['error_message'] = row[20] if row[20] else None
                     topics.append(topic)
                 
-                return topics
+                if rows:
+                    total = rows[0][21]
+                elif offset:
+                    # Past the last page there are no rows to carry the total
+                    total = self.get_topics_count(search, category, status, complexity, company)
+                else:
+                    total = 0
+                
+                return topics, total
                 
         except Exception as e:
             print(f"Error getting paginated topics: {e}")
-            return []
+            return [], 0
     
     def get_total_topics_count(self) -> int:
         """Get total number of topics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT COUNT(*) FROM topics")
                 return cursor.fetchone()[0]
@@ -547,6 +1050,149 @@ class TopicsDatabase:
             print(f"Error getting total topics count: {e}")
             return 0
     
+    def get_topics_after(self, cursor_created_date: Optional[str] = None,
+                         cursor_id: Optional[int] = None, limit: int = 20,
+                         search: str = '', category: str = '', status: str = '',
+                         complexity: str = '', company: str = '',
+                         fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Get the page of topics that follows a keyset cursor.
+        
+        Topics are ordered newest first by (created_date, id). Pass the
+        created_date and id of the last topic on the previous page to get
+        the next one, or leave both as None for the first page. Unlike
+        OFFSET, this seeks straight to the cursor in idx_topics_created,
+        so deep pages cost the same as the first.
+        
+        Args:
+            cursor_created_date: created_date of the last topic already seen
+            cursor_id: id of the last topic already seen
+            limit: Maximum number of topics to return
+            search: Search term for title
+            category: Filter by category
+            status: Filter by processing status
+            complexity: Filter by complexity level
+            company: Filter by company
+            fields: Optional topic keys to include (see _row_to_topic_dict)
+            
+        Returns:
+            List of topic dictionaries
+        """
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                
+                where_conditions, params = self._filter_conditions(
+                    search, category, status, complexity, company)
+                if cursor_created_date is not None and cursor_id is not None:
+                    where_conditions.append("(t.created_date, t.id) < (?, ?)")
+                    params.extend([cursor_created_date, cursor_id])
+                
+                query = _topics_after_sql(tuple(where_conditions))
+                
+                params.append(limit)
+                cursor.execute(query, params)
+                
+                topics = []
+                for row in cursor:
+                    topic = self._row_to_topic_dict(row[:19], fields)  # First 19 columns are topic data
+                    topic['processing_status'] = row[19] if row[19] else 'completed'
+                    topic['error_message'] = row[20] if row[20] else None
+                    topics.append(topic)
+                
+                return topics
+                
+        except Exception as e:
+            print(f"Error getting topics after cursor: {e}")
+            return []
+    
+    def _filter_conditions(self, search: str, category: str, status: str,
+                           complexity: str, company: str) -> Tuple[List[str], List[Any]]:
+        """Build the WHERE conditions and parameters shared by the topic listings."""
+        where_conditions = []
+        params = []
+        
+        if search:
+            condition, param = self._title_search_condition(search)
+            where_conditions.append(condition)
+            params.append(param)
+        
+        if category:
+            where_conditions.append("t.category = ?")
+            params.append(category)
+        
+        if complexity:
+            where_conditions.append("t.complexity_level = ?")
+            params.append(complexity)
+        
+        if company:
+            where_conditions.append("t.company = ?")
+            params.append(company)
+        
+        if status:
+            if status == 'completed':
+                where_conditions.append("(ts.status = 'completed' OR ts.status IS NULL)")
+            elif status == 'pending':
+                where_conditions.append("ts.status = 'pending'")
+            elif status == 'failed':
+                where_conditions.append("ts.status = 'failed'")
+        
+        return where_conditions, params
+    
+    def _title_search_condition(self, search: str) -> Tuple[str, str]:
+        """Build the WHERE condition and parameter for a title search.
+        
+        Uses the topics_fts index when available; terms shorter than a
+        trigram can't be looked up there and fall back to LIKE.
+        """
+        if self._fts_enabled and len(search) >= _TRIGRAM_MIN_LENGTH:
+            # Quote the term as a single FTS5 string so operators and
+            # punctuation in it are matched literally
+            phrase = '"' + search.replace('"', '""') + '"'
+            return "t.id IN (SELECT rowid FROM topics_fts WHERE title MATCH ?)", phrase
+        return "t.title LIKE ?", f"%{search}%"
+    
+    def search_topics(self, query: str, fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Find topics whose title, description, company or technologies contain a term.
+        
+        Matching is a case-insensitive substring test, answered from the
+        topics_fts index; terms shorter than a trigram fall back to LIKE.
+        
+        Args:
+            query: Text to look for
+            fields: Optional topic keys to include (see _row_to_topic_dict)
+            
+        Returns:
+            List of matching topic dictionaries, ordered by ID
+        """
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                if self._fts_enabled and len(query) >= _TRIGRAM_MIN_LENGTH:
+                    phrase = '"' + query.replace('"', '""') + '"'
+                    cursor.execute("""
+                        SELECT * FROM topics
+                        WHERE id IN (SELECT rowid FROM topics_fts WHERE topics_fts MATCH ?)
+                        ORDER BY id
+                    """, (phrase,))
+                else:
+                    # Technologies are tested element by element inside
+                    # SQLite; MessagePack BLOBs can't go through json_each
+                    pattern = f"%{query}%"
+                    cursor.execute("""
+                        SELECT * FROM topics
+                        WHERE title LIKE :pattern OR description LIKE :pattern OR company LIKE :pattern
+                           OR CASE WHEN typeof(technologies) = 'blob' THEN CAST(technologies AS TEXT) LIKE :pattern
+                              ELSE EXISTS (SELECT 1 FROM json_each(technologies) WHERE value LIKE :pattern)
+                              END
+                        ORDER BY id
+                    """, {'pattern': pattern})
+                
+                return [self._row_to_topic_dict(row, fields) for row in cursor]
+                
+        except Exception as e:
+            print(f"Error searching topics for {query!r}: {e}")
+            return []
+    
     def get_topics_count(self, search: str = '', category: str = '', status: str = '', 
                         complexity: str = '', company: str = '') -> int:
         """Get count of topics with search and filtering.
@@ -562,49 +1208,14 @@ class TopicsDatabase:
             Count of matching topics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
                 # Build WHERE clause (same logic as get_topics_paginated)
-                where_conditions = []
-                params = []
-                
-                if search:
-                    where_conditions.append("t.title LIKE ?")
-                    params.append(f"%{search}%")
-                
-                if category:
-                    where_conditions.append("t.category = ?")
-                    params.append(category)
-                
-                if complexity:
-                    where_conditions.append("t.complexity_level = ?")
-                    params.append(complexity)
-                
-                if company:
-                    where_conditions.append("t.company = ?")
-                    params.append(company)
-                
-                if status:
-                    if status == 'completed':
-                        where_conditions.append("(ts.status = 'completed' OR ts.status IS NULL)")
-                    elif status == 'pending':
-                        where_conditions.append("ts.status = 'pending'")
-                    elif status == 'failed':
-                        where_conditions.append("ts.status = 'failed'")
-                
-                where_clause = ""
-                if where_conditions:
-                    where_clause = "WHERE " + " AND ".join(where_conditions)
-                
-                query = f"""
-                    SELECT COUNT(*)
-                    FROM topics t
-                    LEFT JOIN topic_status ts ON t.id = ts.id
-                    {where_clause}
-                """
+                where_conditions, params = self._filter_conditions(
+                    search, category, status, complexity, company)
                 
-                cursor.execute(query, params)
+                cursor.execute(_topics_count_sql(tuple(where_conditions)), params)
                 return cursor.fetchone()[0]
         except Exception as e:
             print(f"Error getting topics count: {e}")
@@ -620,7 +1231,7 @@ class TopicsDatabase:
             True if topic exists and is completed, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
                 # Check if topic exists in topics table AND has completed status
@@ -656,7 +1267,7 @@ class TopicsDatabase:
             Topic dictionary if found, None otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM topics WHERE title = ?", (title.strip(),))
                 row = cursor.fetchone()
@@ -676,30 +1287,32 @@ class TopicsDatabase:
             Number of failed topics removed
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                # Get all failed topic IDs
-                cursor.execute("SELECT id FROM topic_status WHERE status = 'failed'")
-                failed_ids = [row[0] for row in cursor.fetchall()]
-                
-                if not failed_ids:
-                    return 0
-                
-                # Remove from topics table
-                placeholders = ','.join(['?' for _ in failed_ids])
-                cursor.execute(f"DELETE FROM topics WHERE id IN ({placeholders})", failed_ids)
-                
-                # Remove from topic_status table
-                cursor.execute(f"DELETE FROM topic_status WHERE id IN ({placeholders})", failed_ids)
+                # Take the write lock up front so the three deletes see the
+                # same set of failed topics and commit together
+                cursor.execute("BEGIN IMMEDIATE")
                 
-                # Remove from processing_log table
-                cursor.execute(f"DELETE FROM processing_log WHERE topic_id IN ({placeholders})", failed_ids)
+                # Select the failed IDs inside SQLite rather than binding them
+                # as parameters; topic_status goes last since the others
+                # read from it
+                cursor.execute("""
+                    DELETE FROM topics
+                    WHERE id IN (SELECT id FROM topic_status WHERE status = 'failed')
+                """)
+                cursor.execute("""
+                    DELETE FROM processing_log
+                    WHERE topic_id IN (SELECT id FROM topic_status WHERE status = 'failed')
+                """)
+                cursor.execute("DELETE FROM topic_status WHERE status = 'failed'")
+                removed = cursor.rowcount
                 
                 conn.commit()
                 
-                print(f"Cleaned up {len(failed_ids)} failed topics")
-                return len(failed_ids)
+                if removed:
+                    print(f"Cleaned up {removed} failed topics")
+                return removed
                 
         except Exception as e:
             print(f"Error cleaning up failed topics: {e}")
@@ -712,21 +1325,26 @@ class TopicsDatabase:
             Dictionary with status counts
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
-                # Get status counts
+                # Count per status by walking idx_topic_status_status (which
+                # carries id as its rowid) with a primary-key probe into
+                # topics, instead of joining every topic to its status
                 cursor.execute("""
-                    SELECT 
-                        COALESCE(ts.status, 'no_status') as status,
-                        COUNT(*) as count
-                    FROM topics t
-                    LEFT JOIN topic_status ts ON t.id = ts.id
-                    GROUP BY COALESCE(ts.status, 'no_status')
+                    SELECT ts.status, COUNT(*)
+                    FROM topic_status ts
+                    JOIN topics t ON t.id = ts.id
+                    GROUP BY ts.status
                 """)
+                summary = dict(cursor.fetchall())
                 
-                results = cursor.fetchall()
-                return {status: count for status, count in results}
+                # Topics without a status row make up the rest
+                cursor.execute("SELECT COUNT(*) FROM topics")
+                no_status = cursor.fetchone()[0] - sum(summary.values())
+                if no_status:
+                    summary['no_status'] = no_status
+                return summary
                 
         except Exception as e:
             print(f"Error getting topic status summary: {e}")
@@ -739,7 +1357,7 @@ class TopicsDatabase:
             Next available ID
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 
                 # Get the maximum ID from topics table
@@ -763,7 +1381,7 @@ class TopicsDatabase:
             True if topic exists, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT id FROM topics WHERE title = ?", (title.strip(),))
                 return cursor.fetchone() is not None
@@ -782,8 +1400,10 @@ class TopicsDatabase:
             Dictionary with topic data and status, or None if not found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
+                # Only this cursor: other queries hand their tuples to callers
+                cursor.row_factory = sqlite3.Row
                 
                 # Get topic with status
                 cursor.execute("""
@@ -795,81 +1415,139 @@ class TopicsDatabase:
                 
                 row = cursor.fetchone()
                 if row:
-                    columns = [description[0] for description in cursor.description]
-                    return dict(zip(columns, row))
+                    topic = dict(row)
+                    # Callers get the JSON columns as text whatever the storage
+                    for name in _JSON_TOPIC_COLUMNS:
+                        if isinstance(topic[name], bytes):
+                            topic[name] = _dumps(_load_column(topic[name]))
+                    return topic
                 return None
                 
         except Exception as e:
             print(f"Error getting topic by title: {e}")
             return None
 
-    def get_detailed_stats(self) -> Dict[str, Any]:
-        """Get detailed statistics for analytics."""
+    def migrate_json_columns(self, to_msgpack: bool = True) -> int:
+        """Rewrite the stored JSON columns of every topic in one format.
+        
+        Converts JSON text to MessagePack BLOBs, or back again with
+        to_msgpack=False, in a single transaction. Values already in the
+        target format are left alone. Open the database with a matching
+        msgpack_columns setting afterwards so new topics use it too.
+        
+        Args:
+            to_msgpack: Convert to MessagePack (True) or JSON text (False)
+            
+        Returns:
+            Number of topics rewritten
+        """
+        if to_msgpack and msgspec is None:
+            raise ImportError("Migrating to MessagePack requires the msgspec package")
+        encode = _msgpack_encode if to_msgpack else _dumps
+        columns = sorted(_JSON_TOPIC_COLUMNS)
+        
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(f"SELECT id, {', '.join(columns)} FROM topics")
+            
+            updates = []
+            for row in cursor.fetchall():
+                values = list(row[1:])
+                changed = False
+                for i, value in enumerate(values):
+                    if isinstance(value, bytes) != to_msgpack:
+                        values[i] = encode(_load_column(value))
+                        changed = True
+                if changed:
+                    updates.append((*values, row[0]))
+            
+            assignments = ', '.join(f"{column} = ?" for column in columns)
+            cursor.executemany(f"UPDATE topics SET {assignments} WHERE id = ?", updates)
+        
+        print(f"Migrated {len(updates)} topics to {'MessagePack' if to_msgpack else 'JSON'} columns")
+        return len(updates)
+    
+    def _refresh_stats(self, max_age: float) -> None:
+        """Rebuild stats_rollup from topics and topic_status if it is stale."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            
+            # Another thread may have refreshed while we waited for the lock
+            cursor.execute("SELECT dirty, refreshed_at FROM stats_meta")
+            dirty, refreshed_at = cursor.fetchone()
+            if not dirty and refreshed_at is not None and time.time() - refreshed_at <= max_age:
+                return
+            
+            cursor.execute("SELECT COUNT(*) FROM topics")
+            rows = [('total_topics', 0, None, cursor.fetchone()[0])]
+            since = datetime.now(timezone.utc) - _STATS_DAILY_WINDOW
+            params = {'since': since.strftime('%Y-%m-%d %H:%M:%S')}
+            for kind, query in _STATS_QUERIES:
+                cursor.execute(query, params)
+                rows.extend((kind, position, key, count)
+                            for position, (key, count) in enumerate(cursor.fetchall()))
+            
+            cursor.execute("DELETE FROM stats_rollup")
+            cursor.executemany(
+                "INSERT INTO stats_rollup (kind, position, key, value) VALUES (?, ?, ?, ?)", rows)
+            cursor.execute("UPDATE stats_meta SET dirty = 0, refreshed_at = ?", (time.time(),))
+    
+    def get_detailed_stats(self, max_age: float = _STATS_MAX_AGE) -> Dict[str, Any]:
+        """Get detailed statistics for analytics.
+        
+        Served from the stats_rollup table, which is rebuilt when topics or
+        statuses have changed since the last read, or after max_age seconds.
+        A result is returned again without querying for up to 30 seconds
+        (capped at max_age) unless this instance has written since; the
+        same dict is returned, so callers must not modify it.
+        
+        Args:
+            max_age: Seconds an unchanged roll-up is reused before rebuilding
+        """
+        cached = self._stats_cache
+        if (cached is not None and cached[0] == self._write_count
+                and time.monotonic() - cached[1] < min(self._stats_ttl, max_age)):
+            return cached[2]
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
-                
-                # Basic stats
-                cursor.execute("SELECT COUNT(*) FROM topics")
-                total_topics = cursor.fetchone()[0]
-                
-                # Status breakdown
-                cursor.execute("""
-                    SELECT 
-                        COALESCE(ts.status, 'completed') as status,
-                        COUNT(*) as count
-                    FROM topics t
-                    LEFT JOIN topic_status ts ON t.id = ts.id
-                    GROUP BY COALESCE(ts.status, 'completed')
-                """)
-                status_breakdown = dict(cursor.fetchall())
-                
-                # Category breakdown
-                cursor.execute("""
-                    SELECT category, COUNT(*) 
-                    FROM topics 
-                    GROUP BY category 
-                    ORDER BY COUNT(*) DESC
-                """)
-                category_breakdown = dict(cursor.fetchall())
-                
-                # Complexity breakdown
-                cursor.execute("""
-                    SELECT complexity_level, COUNT(*) 
-                    FROM topics 
-                    GROUP BY complexity_level 
-                    ORDER BY COUNT(*) DESC
-                """)
-                complexity_breakdown = dict(cursor.fetchall())
-                
-                # Daily processing stats
-                cursor.execute("""
-                    SELECT DATE(generated_at) as date, COUNT(*) as count
-                    FROM topics
-                    WHERE generated_at >= datetime('now', '-30 days')
-                    GROUP BY DATE(generated_at)
-                    ORDER BY date DESC
-                """)
-                daily_stats = cursor.fetchall()
-                
-                # Company breakdown
-                cursor.execute("""
-                    SELECT company, COUNT(*) 
-                    FROM topics 
-                    GROUP BY company 
-                    ORDER BY COUNT(*) DESC
-                    LIMIT 10
-                """)
-                company_breakdown = dict(cursor.fetchall())
-                
-                return {
-                    'total_topics': total_topics,
-                    'status_breakdown': status_breakdown,
-                    'category_breakdown': category_breakdown,
-                    'complexity_breakdown': complexity_breakdown,
-                    'daily_stats': daily_stats,
-                    'company_breakdown': company_breakdown
-                }
+                cursor.execute("SELECT dirty, refreshed_at FROM stats_meta")
+                dirty, refreshed_at = cursor.fetchone()
+            
+            if dirty or refreshed_at is None or time.time() - refreshed_at > max_age:
+                self._refresh_stats(max_age)
+            
+            # Taken after the refresh's own commit; a write that commits
+            # while the roll-up is read below keeps the result uncached
+            write_count = self._write_count
+            started = time.monotonic()
+            with self._read() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT kind, key, value FROM stats_rollup ORDER BY kind, position")
+                rows = cursor.fetchall()
+            
+            stats = {
+                'total_topics': 0,
+                'status_breakdown': {},
+                'category_breakdown': {},
+                'complexity_breakdown': {},
+                'daily_stats': [],
+                'company_breakdown': {}
+            }
+            for kind, key, value in rows:
+                if kind == 'total_topics':
+                    stats['total_topics'] = value
+                elif kind == 'daily_stats':
+                    stats['daily_stats'].append((key, value))
+                else:
+                    stats[kind][key] = value
+            
+            if self._write_count == write_count:
+                self._stats_cache = (write_count, started, stats)
+            return stats
                 
         except Exception as e:
             print(f"Error getting detailed stats: {e}")
@@ -9,11 +9,15 @@ import sys
 from pathlib import Path
 from database import TopicsDatabase
 
+# Keys printed by list_topics; the other JSON columns are left undecoded
+_LIST_FIELDS = ('id', 'title', 'category', 'company', 'complexity_level',
+               'difficulty', 'technologies', 'estimated_read_time')
+
 
 def show_stats(db_path: str = None):
     """Show database statistics."""
-    db = TopicsDatabase(db_path)
-    stats = db.get_topics_stats()
+    with TopicsDatabase(db_path) as db:
+        stats = db.get_topics_stats()
     
     print("Database Statistics")
     print("=" * 50)
@@ -34,14 +38,13 @@ def show_stats(db_path: str = None):
 
 def list_topics(db_path: str = None, category: str = None, limit: int = 10):
     """List topics in the database."""
-    db = TopicsDatabase(db_path)
-    
-    if category:
-        topics = db.get_topics_by_category(category)
-        print(f"Topics in category '{category}':")
-    else:
-        topics = db.get_all_topics(limit)
-        print(f"Recent topics (limit {limit}):")
+    with TopicsDatabase(db_path) as db:
+        if category:
+            topics = db.get_topics_by_category(category, fields=_LIST_FIELDS)
+            print(f"Topics in category '{category}':")
+        else:
+            topics = db.get_all_topics(limit, fields=_LIST_FIELDS)
+            print(f"Recent topics (limit {limit}):")
     
     print("=" * 50)
     
@@ -62,8 +65,8 @@ def show_topic(db_path: str = None, topic_id: int = None):
         print("Error: Topic ID required")
         return
     
-    db = TopicsDatabase(db_path)
-    topic = db.get_topic(topic_id)
+    with TopicsDatabase(db_path) as db:
+        topic = db.get_topic(topic_id)
     
     if not topic:
         print(f"Topic {topic_id} not found")
@@ -108,8 +111,8 @@ def show_topic(db_path: str = None, topic_id: int = None):
 
 def export_topics(db_path: str = None, output_file: str = None):
     """Export all topics to a JSON file."""
-    db = TopicsDatabase(db_path)
-    export_file = db.export_to_json(output_file)
+    with TopicsDatabase(db_path) as db:
+        export_file = db.export_to_json(output_file)
     print(f"Exported topics to: {export_file}")
 
 
@@ -119,19 +122,8 @@ def search_topics(db_path: str = None, query: str = None):
         print("Error: Search query required")
         return
     
-    db = TopicsDatabase(db_path)
-    topics = db.get_all_topics()
-    
-    # Simple text search
-    matching_topics = []
-    query_lower = query.lower()
-    
-    for topic in topics:
-        if (query_lower in topic['title'].lower() or 
-            query_lower in topic['description'].lower() or
-            query_lower in topic['company'].lower() or
-            any(query_lower in tech.lower() for tech in topic['technologies'])):
-            matching_topics.append(topic)
+    with TopicsDatabase(db_path) as db:
+        matching_topics = db.search_topics(query, fields=('id', 'title', 'company', 'category'))
     
     print(f"Search results for '{query}':")
     print("=" * 50)
@@ -8,6 +8,13 @@ import sqlite3
 import sys
 from pathlib import Path
 
+def optimize(conn):
+    """Refresh planner statistics where needed and close the connection."""
+    print("🔧 Running PRAGMA optimize...")
+    conn.execute("PRAGMA analysis_limit=1000;")
+    conn.execute("PRAGMA optimize;")
+    conn.close()
+
 def enable_wal_mode(db_path: str):
     """Enable WAL mode for better concurrency."""
     
@@ -27,27 +34,21 @@ def enable_wal_mode(db_path: str):
         
         if current_mode.lower() == 'wal':
             print("✅ WAL mode already enabled!")
+            optimize(conn)
             return True
         
-        # Enable WAL mode
+        # Enable WAL mode; the PRAGMA returns the mode now in effect
         print("🔄 Enabling WAL mode...")
         cursor.execute("PRAGMA journal_mode=WAL;")
         new_mode = cursor.fetchone()[0]
         
-        # Verify
-        cursor.execute("PRAGMA journal_mode;")
-        verify_mode = cursor.fetchone()[0]
-        
-        if verify_mode.lower() == 'wal':
-            print(f"✅ WAL mode enabled successfully! (was: {current_mode}, now: {verify_mode})")
+        if new_mode.lower() == 'wal':
+            print(f"✅ WAL mode enabled successfully! (was: {current_mode}, now: {new_mode})")
             
-            # Set other optimizations
-            print("🔧 Applying additional optimizations...")
-            cursor.execute("PRAGMA busy_timeout = 30000;")
-            cursor.execute("PRAGMA synchronous = NORMAL;")  # Faster, still safe with WAL
-            
-            conn.commit()
-            conn.close()
+            # journal_mode is the only setting that persists in the file;
+            # synchronous, cache_size, mmap_size etc. are per connection and
+            # are applied by the application when it connects
+            optimize(conn)
             
             print("\n✅ All optimizations applied!")
             print(f"📁 You should now see these files:")
@@ -57,7 +58,8 @@ def enable_wal_mode(db_path: str):
             print("\n🚀 Restart your application to use WAL mode.")
             return True
         else:
-            print(f"❌ Failed to enable WAL mode. Current mode: {verify_mode}")
+            print(f"❌ Failed to enable WAL mode. Current mode: {new_mode}")
+            conn.close()
             return False
             
     except Exception as e:
@@ -11,20 +11,28 @@ def fix_migration():
     """Copy data directly from topics.db to unified.db using SQL."""
     print("🔧 Fixing migration with direct SQL copy...")
     
-    # Connect to both databases
-    old_conn = sqlite3.connect("topics.db")
+    # Attach topics.db to the unified.db connection so the copy runs as
+    # INSERT ... SELECT inside SQLite, without rows passing through Python
     new_conn = sqlite3.connect("unified.db")
-    
-    old_cursor = old_conn.cursor()
+    # Keeps the topics_fts triggers from database.py correct for REPLACE writes
+    new_conn.execute("PRAGMA recursive_triggers=ON")
     new_cursor = new_conn.cursor()
     
     try:
+        new_cursor.execute("ATTACH DATABASE ? AS old", ("topics.db",))
+        
+        # One-shot bulk load: skip fsyncs until it is done
+        synchronous = new_cursor.execute("PRAGMA main.synchronous").fetchone()[0]
+        new_cursor.execute("PRAGMA main.synchronous=OFF")
+        
+        new_cursor.execute("BEGIN IMMEDIATE")
+        
         # Drop existing topics table in unified.db
-        new_cursor.execute("DROP TABLE IF EXISTS topics")
+        new_cursor.execute("DROP TABLE IF EXISTS main.topics")
         
         # Create the correct topics table schema
         new_cursor.execute("""
-            CREATE TABLE topics (
+            CREATE TABLE main.topics (
                 id INTEGER PRIMARY KEY,
                 title TEXT NOT NULL,
                 description TEXT NOT NULL,
@@ -50,56 +58,50 @@ def fix_migration():
         """)
         
         # Create indexes
-        new_cursor.execute("CREATE INDEX idx_topics_category ON topics(category)")
-        new_cursor.execute("CREATE INDEX idx_topics_company ON topics(company)")
-        new_cursor.execute("CREATE INDEX idx_topics_complexity ON topics(complexity_level)")
-        new_cursor.execute("CREATE INDEX idx_topics_difficulty ON topics(difficulty)")
-        
-        # Copy all data from old to new
-        old_cursor.execute("SELECT * FROM topics")
-        topics = old_cursor.fetchall()
-        
-        print(f"📊 Copying {len(topics)} topics...")
+        new_cursor.execute("CREATE INDEX main.idx_topics_category ON topics(category)")
+        new_cursor.execute("CREATE INDEX main.idx_topics_company ON topics(company)")
+        new_cursor.execute("CREATE INDEX main.idx_topics_complexity ON topics(complexity_level)")
+        new_cursor.execute("CREATE INDEX main.idx_topics_difficulty ON topics(difficulty)")
         
-        for topic in topics:
-            # Add 'migrated' as source
-            topic_with_source = topic + ('migrated',)
-            
-            new_cursor.execute("""
-                INSERT INTO topics 
-                (id, title, description, category, subcategory, company, technologies,
-                 complexity_level, tags, related_topics, metrics, implementation_details,
-                 learning_objectives, difficulty, estimated_read_time, prerequisites,
-                 created_date, updated_date, generated_at, source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, topic_with_source)
+        # Copy all data from old to new, adding 'migrated' as source
+        new_cursor.execute("""
+            INSERT INTO main.topics 
+            (id, title, description, category, subcategory, company, technologies,
+             complexity_level, tags, related_topics, metrics, implementation_details,
+             learning_objectives, difficulty, estimated_read_time, prerequisites,
+             created_date, updated_date, generated_at, source)
+            SELECT id, title, description, category, subcategory, company, technologies,
+                   complexity_level, tags, related_topics, metrics, implementation_details,
+                   learning_objectives, difficulty, estimated_read_time, prerequisites,
+                   created_date, updated_date, generated_at, 'migrated'
+            FROM old.topics
+        """)
+        print(f"📊 Copied {new_cursor.rowcount} topics")
         
         # Copy topic_status data
-        old_cursor.execute("SELECT * FROM topic_status")
-        statuses = old_cursor.fetchall()
-        
-        print(f"📊 Copying {len(statuses)} topic statuses...")
-        
-        for status in statuses:
-            # topic_status table has: id, title, status, error_message, created_at, updated_at
-            # But our unified schema expects: id, topic_id, title, status, error_message, created_at, updated_at
-            # So we need to add a topic_id (we'll use the id as topic_id for now)
-            status_with_topic_id = (status[0], status[0], status[1], status[2], status[3], status[4], status[5])
-            
-            new_cursor.execute("""
-                INSERT OR REPLACE INTO topic_status 
-                (id, topic_id, title, status, error_message, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, status_with_topic_id)
+        # topic_status table has: id, title, status, error_message, created_at, updated_at
+        # But our unified schema expects: id, topic_id, title, status, error_message, created_at, updated_at
+        # So we need to add a topic_id (we'll use the id as topic_id for now)
+        new_cursor.execute("""
+            INSERT OR REPLACE INTO main.topic_status 
+            (id, topic_id, title, status, error_message, created_at, updated_at)
+            SELECT id, id, title, status, error_message, created_at, updated_at
+            FROM old.topic_status
+        """)
+        print(f"📊 Copied {new_cursor.rowcount} topic statuses")
         
         new_conn.commit()
+        new_cursor.execute(f"PRAGMA main.synchronous={synchronous}")
+        new_cursor.execute("DETACH DATABASE old")
+        # Give the planner statistics for the freshly loaded tables
+        new_cursor.execute("ANALYZE")
         print("✅ Migration fixed successfully!")
         
         # Show final stats
-        new_cursor.execute("SELECT COUNT(*) FROM topics")
+        new_cursor.execute("SELECT COUNT(*) FROM main.topics")
         topic_count = new_cursor.fetchone()[0]
         
-        new_cursor.execute("SELECT COUNT(*) FROM topic_status")
+        new_cursor.execute("SELECT COUNT(*) FROM main.topic_status")
         status_count = new_cursor.fetchone()[0]
         
         print(f"📈 Final Stats:")
@@ -109,7 +111,6 @@ def fix_migration():
     except Exception as e:
         print(f"❌ Error: {e}")
     finally:
-        old_conn.close()
         new_conn.close()
 
 
@@ -6,23 +6,25 @@ because the title format doesn't match between processing and completed.
 import sqlite3
 import re
 
+_NUM_RE = re.compile(r'^\d+\.\s*')
+# "... how **", "... reveal how **", "... show how **", "... explain how **"
+# and "... tell you how **" all end in "how", so the lazy ".*?how" covers them
+_GIVE_RE = re.compile(r'^Give me \d+ seconds?,.*?how\s*\*\*', re.IGNORECASE)
+_TRAIL_RE = re.compile(r'\s*\.\s*$')
+
 def clean_title(title):
     """Clean a title to its core content."""
     # Remove numbering like "167. "
-    title = re.sub(r'^\d+\.\s*', '', title)
+    title = _NUM_RE.sub('', title)
     
     # Remove "Give me 10 seconds..." prefix
-    title = re.sub(r'^Give me \d+ seconds?,.*?how\s*\*\*', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'^Give me \d+ seconds?,.*?reveal how\s*\*\*', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'^Give me \d+ seconds?,.*?show how\s*\*\*', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'^Give me \d+ seconds?,.*?explain how\s*\*\*', '', title, flags=re.IGNORECASE)
-    title = re.sub(r'^Give me \d+ seconds?,.*?tell you how\s*\*\*', '', title, flags=re.IGNORECASE)
+    title = _GIVE_RE.sub('', title)
     
     # Remove ** markdown
     title = title.replace('**', '')
     
     # Remove trailing punctuation and whitespace
-    title = re.sub(r'\s*\.\s*$', '', title)
+    title = _TRAIL_RE.sub('', title)
     title = title.strip()
     
     return title
@@ -60,46 +62,44 @@ def fix_processing_titles():
         print(f"Cleaned:  {clean}")
     
     # Check for matches
-    fixed_count = 0
+    to_complete = []
     no_match_count = 0
     
     print("\n" + "-" * 80)
     print("Checking for completed versions of processing topics...")
     
+    # Load the completed titles once instead of querying per processing
+    # topic. A completed version matches when its title contains the
+    # cleaned title, case-insensitively (what title = ? / LIKE ? /
+    # LIKE '%clean%' used to test), so keep an exact-match set plus one
+    # newline-joined string for the substring check.
+    cursor.execute("SELECT title FROM topic_status WHERE status = 'completed'")
+    completed_titles = {row[0].lower() for row in cursor.fetchall() if row[0]}
+    completed_text = "\n".join(completed_titles)
+    
     for title, created_at in processing_topics:
-        clean = clean_title(title)
+        clean = clean_title(title).lower()
         
         # Check if a completed version exists
-        cursor.execute("""
-            SELECT COUNT(*) 
-            FROM topic_status 
-            WHERE status = 'completed' 
-            AND (
-                title = ? 
-                OR title LIKE ?
-                OR title LIKE ?
-            )
-        """, (clean, f"%{clean}%", clean))
-        
-        match_count = cursor.fetchone()[0]
-        
-        if match_count > 0:
-            # Update the processing one to completed
-            cursor.execute("""
-                UPDATE topic_status 
-                SET status = 'completed' 
-                WHERE title = ? AND status = 'processing'
-            """, (title,))
-            
-            if cursor.rowcount > 0:
-                fixed_count += 1
-                if fixed_count <= 5:
-                    print(f"✓ Fixed: {title[:60]}...")
+        if clean in completed_titles or (completed_titles and clean in completed_text):
+            to_complete.append(title)
         else:
             no_match_count += 1
     
+    # Update the processing ones to completed in one pass; a title listed
+    # twice is only counted once, as its first UPDATE covers both rows
+    to_complete = list(dict.fromkeys(to_complete))
+    cursor.executemany("""
+        UPDATE topic_status 
+        SET status = 'completed' 
+        WHERE title = ? AND status = 'processing'
+    """, ((title,) for title in to_complete))
     conn.commit()
     
+    fixed_count = len(to_complete)
+    for title in to_complete[:5]:
+        print(f"✓ Fixed: {title[:60]}...")
+    
     print(f"\n" + "-" * 80)
     print(f"RESULTS:")
     print(f"  - Fixed: {fixed_count} topics (marked as completed)")
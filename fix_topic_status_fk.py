@@ -16,23 +16,23 @@ def fix_foreign_key():
     
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    # WAL is stored in the database file, so it also stays on for the app;
+    # the other settings only apply to this connection
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")  # 64MB
     cursor = conn.cursor()
     
     try:
-        # Get current data
-        print("Backing up existing data...")
-        cursor.execute("SELECT * FROM topic_status")
-        existing_data = cursor.fetchall()
-        print(f"Found {len(existing_data)} existing records")
-        
-        # Drop the old table
-        print("Dropping old table...")
-        cursor.execute("DROP TABLE IF EXISTS topic_status")
+        # Take the write lock up front; the copy and table swap below then
+        # commit (or roll back) together
+        cursor.execute("BEGIN IMMEDIATE")
         
         # Create new table WITHOUT the foreign key constraint
         print("Creating new table without foreign key...")
         cursor.execute("""
-            CREATE TABLE topic_status (
+            CREATE TABLE topic_status_new (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 original_title TEXT NOT NULL UNIQUE,
                 current_title TEXT,
@@ -43,23 +43,24 @@ def fix_foreign_key():
             )
         """)
         
-        # Re-insert data
-        if existing_data:
-            print(f"Restoring {len(existing_data)} records...")
-            for row in existing_data:
-                cursor.execute("""
-                    INSERT INTO topic_status 
-                    (id, original_title, current_title, status, error_message, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    row['id'],
-                    row['original_title'],
-                    row['current_title'],
-                    row['status'],
-                    row['error_message'],
-                    row['created_at'],
-                    row['updated_at']
-                ))
+        # Copy the rows inside SQLite, keeping their ids
+        print("Copying existing data...")
+        cursor.execute("""
+            INSERT INTO topic_status_new 
+            (id, original_title, current_title, status, error_message, created_at, updated_at)
+            SELECT id, original_title, current_title, status, error_message, created_at, updated_at
+            FROM topic_status
+        """)
+        print(f"Copied {cursor.rowcount} existing records")
+        
+        # Swap the new table in for the old one
+        print("Replacing old table...")
+        cursor.execute("DROP TABLE topic_status")
+        cursor.execute("ALTER TABLE topic_status_new RENAME TO topic_status")
+        # Dropping the old table dropped its indexes; original_title is
+        # covered by its UNIQUE constraint
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_topic_status_status ON topic_status(status)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_topic_status_current_title ON topic_status(current_title)")
         
         conn.commit()
         print("✅ Successfully fixed foreign key constraint")
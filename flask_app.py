@@ -6,10 +6,11 @@ Provides a beautiful UI for bulk topic entry, progress tracking, and analytics.
 
 import os
 import json
+import queue
 import threading
 import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, render_template, request, jsonify, redirect, url_for
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
@@ -22,7 +23,9 @@ from batch_processor import TopicBatchProcessor
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Status payloads are small and frequent; compressing them costs more CPU
+# than the bandwidth it saves
+socketio = SocketIO(app, cors_allowed_origins="*", http_compression=False)
 
 # Global variables for processing
 processing_status = {
@@ -37,6 +40,20 @@ processing_status = {
     'errors': []
 }
 
+# status_update emits are coalesced: updates only mark the status dirty and
+# a background task sends the latest state at most this often (seconds)
+STATUS_EMIT_INTERVAL = 0.1
+_status_lock = threading.Lock()
+_status_dirty = threading.Event()
+_status_emitter_started = False
+
+# Shared budget for Gemini calls across all batch worker threads, as a
+# token bucket refilled continuously at this rate (calls per second)
+GEMINI_MAX_CALLS_PER_SECOND = 10
+_rate_lock = threading.Lock()
+_rate_tokens = float(GEMINI_MAX_CALLS_PER_SECOND)
+_rate_updated = time.monotonic()
+
 # Initialize database and processor
 db = unified_db
 processor = None
@@ -53,27 +70,66 @@ def init_processor():
         return False
 
 
-def update_processing_status(status_update):
-    """Update processing status and emit to clients."""
-    global processing_status
-    processing_status.update(status_update)
-    socketio.emit('status_update', processing_status)
+def _emit_status_updates():
+    """Background task sending processing_status to clients when it changed."""
+    while True:
+        socketio.sleep(STATUS_EMIT_INTERVAL)
+        if _status_dirty.is_set():
+            _status_dirty.clear()
+            with _status_lock:
+                snapshot = dict(processing_status)
+                # errors is appended to in place, so send a copy
+                snapshot['errors'] = list(snapshot['errors'])
+            socketio.emit('status_update', snapshot)
 
 
-def process_single_batch(batch, batch_num, all_topic_ids):
-    """Process a single batch of topics."""
+def update_processing_status(status_update):
+    """Update processing status; clients get it on the next emit tick."""
+    global processing_status, _status_emitter_started
+    with _status_lock:
+        processing_status.update(status_update)
+        start_emitter = not _status_emitter_started
+        _status_emitter_started = True
+    _status_dirty.set()
+    if start_emitter:
+        socketio.start_background_task(_emit_status_updates)
+
+
+def acquire_gemini_call():
+    """Block until the shared Gemini call budget has room for one more call."""
+    global _rate_tokens, _rate_updated
+    while True:
+        with _rate_lock:
+            now = time.monotonic()
+            _rate_tokens = min(GEMINI_MAX_CALLS_PER_SECOND,
+                               _rate_tokens + (now - _rate_updated) * GEMINI_MAX_CALLS_PER_SECOND)
+            _rate_updated = now
+            if _rate_tokens >= 1:
+                _rate_tokens -= 1
+                return
+            wait = (1 - _rate_tokens) / GEMINI_MAX_CALLS_PER_SECOND
+        time.sleep(wait)
+
+
+def add_processing_error(message):
+    """Append to processing_status['errors'] in place and schedule an emit."""
+    with _status_lock:
+        processing_status['errors'].append(message)
+    update_processing_status({})
+
+
+def process_single_batch(batch_ids, batch_titles, batch_num, all_topic_ids, batch_date):
+    """Process a single batch of topics, given as parallel id and title lists."""
     try:
-        # Generate topics using Gemini
+        # Wait for room in the shared rate budget, then generate topics using Gemini
+        acquire_gemini_call()
         generated_topics = processor.client.generate_topics(
-            batch, 
+            [{'id': topic_id, 'title': title} for topic_id, title in zip(batch_ids, batch_titles)],
             all_topic_ids=all_topic_ids,
-            created_date=datetime.now().strftime("%Y-%m-%d"),
-            updated_date=datetime.now().strftime("%Y-%m-%d")
+            created_date=batch_date,
+            updated_date=batch_date
         )
         
-        # Small delay to respect rate limits
-        time.sleep(1.0)
-        
         # Handle response (single topic or list)
         if isinstance(generated_topics, dict):
             generated_topics = [generated_topics]
@@ -93,6 +149,75 @@ def process_single_batch(batch, batch_num, all_topic_ids):
         }
 
 
+def write_batch_results(write_queue, source):
+    """
+    Save generated topics and their statuses as batch groups finish.
+    
+    Each queue item is one group's list of (titles, result) pairs; whatever
+    has queued up is written in a single transaction, with every topic
+    tagged with source. None stops the loop.
+    """
+    done = False
+    while not done:
+        groups = [write_queue.get()]
+        while True:
+            try:
+                groups.append(write_queue.get_nowait())
+            except queue.Empty:
+                break
+        if groups[-1] is None:
+            groups.pop()
+            done = True
+        if not groups:
+            continue
+        
+        # Counters are only published once the transaction has committed; if
+        # it rolls back, every topic in these groups counts as failed
+        group_topics = sum(
+            len(result['topics']) if result['success'] else len(titles)
+            for group in groups for titles, result in group
+        )
+        processed = failed = 0
+        batch_errors = []
+        try:
+            with db.transaction():
+                status_rows = []
+                for group in groups:
+                    for titles, result in group:
+                        if result['success']:
+                            generated_topics = result['topics']
+                            
+                            # Save successful topics
+                            for topic in generated_topics:
+                                try:
+                                    db.save_topic(topic, source)
+                                    status_rows.append((topic['title'], 'completed', None))
+                                    processed += 1
+                                except Exception as e:
+                                    status_rows.append((topic['title'], 'failed', str(e)))
+                                    failed += 1
+                        else:
+                            # Handle failed batch
+                            for title in titles:
+                                status_rows.append((title, 'failed', result['error']))
+                            failed += len(titles)
+                            batch_errors.append(f"Batch {result['batch_num'] + 1} failed: {result['error']}")
+                
+                db.save_topic_status_batch(status_rows)
+        except Exception as e:
+            print(f"Saving batch results failed: {e}")
+            add_processing_error(f"Saving batch results failed: {str(e)}")
+            processed, failed = 0, group_topics
+        
+        for error in batch_errors:
+            add_processing_error(error)
+        processing_status['processed_topics'] += processed
+        processing_status['failed_topics'] += failed
+        update_processing_status({
+            'processed_topics': processing_status['processed_topics'],
+            'failed_topics': processing_status['failed_topics']
+        })
+
 def process_topics_background(topic_titles, batch_size=5):
     """Process topics in background thread."""
     global processing_status
@@ -106,162 +231,146 @@ def process_topics_background(topic_titles, batch_size=5):
             })
             return
         
-        # Filter out topics that already exist and are completed
-        topics_to_process = []
-        skipped_topics = []
-        retry_topics = []
+        # Filter out topics that already exist and are completed; the
+        # topics to process are kept as parallel id/title lists
+        pending_ids, pending_titles = [], []
+        retry_ids, retry_titles = [], []
+        # Only a count and the first few titles are ever reported
+        skipped_count = 0
+        skipped_sample = []
         
         # Get the next available ID to avoid conflicts
         next_id = db.get_next_available_id()
         
+        # Look up every submitted title up front instead of once per title
+        existing_topics = db.get_topics_by_titles(topic_titles)
+        
         for i, title in enumerate(topic_titles):
             title = title.strip()
             
             # Check if topic already exists
-            existing_topic = db.get_topic_by_title(title)
+            existing_topic = existing_topics.get(title)
             
             if existing_topic:
                 if existing_topic.get('status') == 'completed':
-                    skipped_topics.append(title)
+                    skipped_count += 1
+                    if len(skipped_sample) < 5:
+                        skipped_sample.append(title)
                     print(f"Skipping existing completed topic: {title}")
                     continue
                 elif existing_topic.get('status') in ['failed', 'pending']:
-                    retry_topics.append({
-                        'id': existing_topic['id'],
-                        'title': title,
-                        'status': 'pending',
-                        'created_at': datetime.now().isoformat()
-                    })
+                    retry_ids.append(existing_topic['id'])
+                    retry_titles.append(title)
                     print(f"Retrying existing topic with status '{existing_topic.get('status')}': {title}")
                     continue
             
             # Use sequential IDs starting from next available ID
-            topic_id = next_id + i
-            topics_to_process.append({
-                'id': topic_id,
-                'title': title,
-                'status': 'pending',
-                'created_at': datetime.now().isoformat()
-            })
+            pending_ids.append(next_id + i)
+            pending_titles.append(title)
         
         # Combine new topics and retry topics
-        all_topics_to_process = topics_to_process + retry_topics
+        all_topic_ids = pending_ids + retry_ids
+        all_titles = pending_titles + retry_titles
         
         # If no topics to process, return early
-        if not all_topics_to_process:
+        if not all_topic_ids:
             update_processing_status({
                 'is_processing': False,
-                'processed_topics': len(skipped_topics),
-                'skipped_topics': len(skipped_topics),
-                'current_topic': f'All {len(skipped_topics)} topics already exist and are completed!'
+                'processed_topics': skipped_count,
+                'skipped_topics': skipped_count,
+                'current_topic': f'All {skipped_count} topics already exist and are completed!'
             })
             return
         
-        # Save topics to process with pending status
-        for topic in all_topics_to_process:
-            db.save_topic_status(topic['title'], 'pending', None)
+        # Save topics to process with pending status, in one transaction
+        db.save_topic_status_batch([(title, 'pending', None) for title in all_titles])
         
         # Update status with skipped topics info
-        if skipped_topics:
+        if skipped_count:
             update_processing_status({
-                'skipped_topics': len(skipped_topics),
-                'skipped_titles': skipped_topics[:5]  # Show first 5 skipped topics
+                'skipped_topics': skipped_count,
+                'skipped_titles': skipped_sample  # Show first 5 skipped topics
             })
         
         # Calculate batches
-        total_batches = (len(all_topics_to_process) + batch_size - 1) // batch_size
+        total_batches = (len(all_topic_ids) + batch_size - 1) // batch_size
         
         update_processing_status({
             'is_processing': True,
             'current_batch': 0,
             'total_batches': total_batches,
-            'processed_topics': len(skipped_topics),  # Count skipped as processed
+            'processed_topics': skipped_count,  # Count skipped as processed
             'failed_topics': 0,
             'current_topic': None,
             'errors': []
         })
         
-        # Process in parallel batches
-        all_topic_ids = [t['id'] for t in all_topics_to_process]
-        
         # Calculate parallel processing parameters
         parallel_batches = min(10, total_batches)  # Max 10 parallel batches
-        batch_groups = []
-        
-        # Group batches for parallel processing
-        for i in range(0, total_batches, parallel_batches):
-            group_batches = []
-            for batch_num in range(i, min(i + parallel_batches, total_batches)):
-                start_idx = batch_num * batch_size
-                end_idx = min(start_idx + batch_size, len(all_topics_to_process))
-                batch = all_topics_to_process[start_idx:end_idx]
-                group_batches.append((batch_num, batch))
-            batch_groups.append(group_batches)
-        
-        # Process each group of batches in parallel
-        for group_idx, batch_group in enumerate(batch_groups):
-            update_processing_status({
-                'current_batch': group_idx + 1,
-                'total_batches': len(batch_groups),
-                'current_topic': f"Processing parallel group {group_idx + 1}/{len(batch_groups)} ({len(batch_group)} batches)"
-            })
-            
-            # Process batches in parallel using ThreadPoolExecutor
+        
+        # Group batches for parallel processing; every size is known up
+        # front, so build the lists in one pass rather than appending
+        batch_groups = [
+            [
+                (batch_num,
+                 all_topic_ids[batch_num * batch_size:(batch_num + 1) * batch_size],
+                 all_titles[batch_num * batch_size:(batch_num + 1) * batch_size])
+                for batch_num in range(i, min(i + parallel_batches, total_batches))
+            ]
+            for i in range(0, total_batches, parallel_batches)
+        ]
+        
+        # Dates and the source tag are fixed for the whole run
+        started_at = datetime.now()
+        batch_date = started_at.strftime("%Y-%m-%d")
+        run_tag = f"web_batch_{started_at.strftime('%Y%m%d_%H%M%S')}"
+        
+        # Generated topics are saved by a separate writer thread, so
+        # SQLite writes never hold up the next group's Gemini calls
+        write_queue = queue.Queue()
+        writer = threading.Thread(target=write_batch_results, args=(write_queue, run_tag), daemon=True)
+        writer.start()
+        
+        try:
+            # Process each group of batches in parallel, reusing one pool of
+            # worker threads for every group
             with ThreadPoolExecutor(max_workers=parallel_batches) as executor:
-                # Submit all batches in this group for parallel processing
-                future_to_batch = {}
-                for batch_num, batch in batch_group:
-                    future = executor.submit(process_single_batch, batch, batch_num, all_topic_ids)
-                    future_to_batch[future] = (batch_num, batch)
-                
-                # Collect results as they complete
-                batch_results = []
-                for future in as_completed(future_to_batch):
-                    batch_num, batch = future_to_batch[future]
-                    try:
-                        result = future.result()
-                        batch_results.append(result)
-                        print(f"Batch {batch_num + 1} completed successfully")
-                    except Exception as e:
-                        print(f"Batch {batch_num + 1} failed: {e}")
-                        batch_results.append({
-                            'batch_num': batch_num,
-                            'success': False,
-                            'error': str(e),
-                            'topics': []
-                        })
-                
-                # Process all results from this parallel group
-                for result in batch_results:
-                    if result['success']:
-                        generated_topics = result['topics']
-                        
-                        # Save successful topics
-                        for topic in generated_topics:
-                            try:
-                                db.save_topic(topic, f"web_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-                                db.save_topic_status(topic['title'], 'completed', None)
-                                
-                                processing_status['processed_topics'] += 1
-                                update_processing_status({
-                                    'processed_topics': processing_status['processed_topics']
-                                })
-                            except Exception as e:
-                                db.save_topic_status(topic['title'], 'failed', str(e))
-                                processing_status['failed_topics'] += 1
-                                update_processing_status({
-                                    'failed_topics': processing_status['failed_topics']
-                                })
-                    else:
-                        # Handle failed batch
-                        for topic in batch_group[result['batch_num']][1]:  # Get the batch topics
-                            db.save_topic_status(topic['title'], 'failed', result['error'])
-                            processing_status['failed_topics'] += 1
-                        
-                        update_processing_status({
-                            'failed_topics': processing_status['failed_topics'],
-                            'errors': processing_status['errors'] + [f"Batch {result['batch_num'] + 1} failed: {result['error']}"]
-                        })
+                for group_idx, batch_group in enumerate(batch_groups):
+                    update_processing_status({
+                        'current_batch': group_idx + 1,
+                        'total_batches': len(batch_groups),
+                        'current_topic': f"Processing parallel group {group_idx + 1}/{len(batch_groups)} ({len(batch_group)} batches)"
+                    })
+                    
+                    # Submit all batches in this group for parallel processing
+                    futures = [
+                        executor.submit(process_single_batch, ids, titles, batch_num, all_topic_ids, batch_date)
+                        for batch_num, ids, titles in batch_group
+                    ]
+                    
+                    # Collect results in submission order; the group is only
+                    # done once its slowest batch is, so nothing waits longer
+                    batch_results = [None] * len(batch_group)
+                    for position, ((batch_num, _, _), future) in enumerate(zip(batch_group, futures)):
+                        try:
+                            batch_results[position] = future.result()
+                            print(f"Batch {batch_num + 1} completed successfully")
+                        except Exception as e:
+                            print(f"Batch {batch_num + 1} failed: {e}")
+                            batch_results[position] = {
+                                'batch_num': batch_num,
+                                'success': False,
+                                'error': str(e),
+                                'topics': []
+                            }
+                    
+                    # Hand the group's results to the writer thread and move
+                    # straight on to the next group's API calls
+                    write_queue.put([(titles, result) for (_, _, titles), result in zip(batch_group, batch_results)])
+        finally:
+            # Let the writer drain everything queued before reporting done
+            write_queue.put(None)
+            writer.join()
         
         # Processing complete
         update_processing_status({
@@ -365,33 +474,63 @@ def get_topics():
         sort_by = request.args.get('sort_by', 'created_date').strip()
         sort_order = request.args.get('sort_order', 'desc').strip()
         
-        # Get topics with search and filters
-        topics = db.get_topics_paginated(
-            offset=offset, 
-            limit=limit,
+        # Optional comma-separated topic IDs to restrict the result to
+        ids_param = request.args.get('ids', '').strip()
+        try:
+            ids = [int(topic_id) for topic_id in ids_param.split(',') if topic_id.strip()]
+        except ValueError:
+            return jsonify({'error': 'ids must be a comma-separated list of integers'}), 400
+        
+        filters = dict(
             search=search or None,
             category=category or None,
             status=status or None,
             complexity=complexity or None,
             company=company or None,
-            sort_by=sort_by,
-            sort_order=sort_order
+            ids=ids or None
         )
         
-        # Get total count for pagination (with same filters)
-        total_count = db.get_topics_count(
-            search=search or None,
-            category=category or None,
-            status=status or None,
-            complexity=complexity or None,
-            company=company or None
+        # Keyset pagination: ?cursor=<next_cursor from the previous page>
+        # seeks past the last topic seen, newest first, instead of using OFFSET
+        cursor_param = request.args.get('cursor', '').strip()
+        if cursor_param:
+            try:
+                cursor_created_date, cursor_id = _parse_topics_cursor(cursor_param)
+            except ValueError:
+                return jsonify({'error': 'cursor must be a next_cursor value from a previous page'}), 400
+            
+            topics = db.get_topics_after(
+                cursor_created_date=cursor_created_date,
+                cursor_id=cursor_id,
+                limit=limit,
+                **filters
+            )
+            return jsonify({
+                'topics': topics,
+                'limit': limit,
+                'next_cursor': _next_topics_cursor(topics, limit)
+            })
+        
+        # Get topics with search and filters, plus the total for pagination
+        topics, total_count = db.get_topics_page_with_count(
+            offset=offset, 
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            **filters
         )
         
+        # A cursor only continues the default newest-first order
+        next_cursor = None
+        if sort_by == 'created_date' and sort_order.lower() == 'desc':
+            next_cursor = _next_topics_cursor(topics, limit)
+        
         return jsonify({
             'topics': topics,
             'total_count': total_count,
             'limit': limit,
-            'offset': offset
+            'offset': offset,
+            'next_cursor': next_cursor
         })
     except Exception as e:
         import logging
@@ -399,6 +538,22 @@ def get_topics():
         return jsonify({'error': str(e)}), 500
 
 
+def _next_topics_cursor(topics, limit):
+    """Build the cursor for the page after ``topics``, or None on the last page."""
+    if len(topics) < limit:
+        return None
+    last = topics[-1]
+    return f"{last['created_date']}|{last['id']}"
+
+
+def _parse_topics_cursor(value):
+    """Split a cursor from _next_topics_cursor into (created_date, id)."""
+    created_date, sep, topic_id = value.rpartition('|')
+    if not sep:
+        raise ValueError(f"Invalid cursor: {value}")
+    return created_date, int(topic_id)
+
+
 @app.route('/api/status')
 def get_status():
     """API endpoint to get current processing status."""
@@ -451,8 +606,9 @@ def retry_topic(topic_id):
         if isinstance(result, dict):
             result = [result]
         
+        source = f"retry_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         for topic in result:
-            db.save_topic(topic, f"retry_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+            db.save_topic(topic, source)
             db.save_topic_status(topic_status['title'], 'completed', None)
         
         return jsonify({'message': 'Topic processed successfully'})
@@ -508,45 +664,48 @@ def get_topic_status_summary():
         }), 500
 
 
+# Lookup tables for the template filters below, built once at import
+_COMPLEXITY_BADGE_CLASSES = {
+    'beginner': 'bg-success',
+    'intermediate': 'bg-warning', 
+    'advanced': 'bg-danger',
+    'expert': 'bg-dark'
+}
+_STATUS_BADGE_CLASSES = {
+    'completed': 'bg-success',
+    'pending': 'bg-warning',
+    'failed': 'bg-danger'
+}
+_STATUS_ICONS = {
+    'completed': 'check-circle',
+    'pending': 'clock',
+    'failed': 'exclamation-triangle'
+}
+_STATUS_COLORS = {
+    'completed': 'success',
+    'pending': 'warning',
+    'failed': 'danger'
+}
+
+
 @app.template_filter('get_complexity_badge_class')
 def get_complexity_badge_class(complexity):
-    classes = {
-        'beginner': 'bg-success',
-        'intermediate': 'bg-warning', 
-        'advanced': 'bg-danger',
-        'expert': 'bg-dark'
-    }
-    return classes.get(complexity, 'bg-secondary')
+    return _COMPLEXITY_BADGE_CLASSES.get(complexity, 'bg-secondary')
 
 
 @app.template_filter('get_status_badge_class')
 def get_status_badge_class(status):
-    classes = {
-        'completed': 'bg-success',
-        'pending': 'bg-warning',
-        'failed': 'bg-danger'
-    }
-    return classes.get(status, 'bg-secondary')
+    return _STATUS_BADGE_CLASSES.get(status, 'bg-secondary')
 
 
 @app.template_filter('get_status_icon')
 def get_status_icon(status):
-    icons = {
-        'completed': 'check-circle',
-        'pending': 'clock',
-        'failed': 'exclamation-triangle'
-    }
-    return icons.get(status, 'question-circle')
+    return _STATUS_ICONS.get(status, 'question-circle')
 
 
 @app.template_filter('get_status_color')
 def get_status_color(status):
-    colors = {
-        'completed': 'success',
-        'pending': 'warning',
-        'failed': 'danger'
-    }
-    return colors.get(status, 'secondary')
+    return _STATUS_COLORS.get(status, 'secondary')
 
 
 if __name__ == '__main__':
@@ -3,26 +3,158 @@
 Gemini 2.5 Flash client for generating system design topics with structured JSON output.
 """
 
+import hashlib
+import itertools
 import json
 import os
+import sqlite3
 import sys
+import threading
+import time
 from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
-from queue import SimpleQueue
-from typing import List, Dict, Any, Union
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Union, Optional
 import requests
-from jsonschema import validate, ValidationError
+from requests.adapters import HTTPAdapter
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 import random
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Request and response bodies go through orjson when it is installed, falling
+# back to json. orjson.JSONDecodeError subclasses json.JSONDecodeError.
+if orjson is not None:
+    def _dumps(value: Any) -> str:
+        return orjson.dumps(value).decode()
+    _dumps_bytes = orjson.dumps
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+
+    def _dumps_bytes(value: Any) -> bytes:
+        return json.dumps(value).encode()
+    _loads = json.loads
+
+
+# Clients created with a cache_path keep validated responses on disk, so a
+# batch that was already generated (e.g. a retry of topics whose save
+# failed) skips the API call
+DEFAULT_RESPONSE_CACHE_PATH = os.path.join("data", "cache", "gemini_responses.db")
+# Bump when the prompt or response handling changes in a way that makes
+# earlier cached responses unusable
+_RESPONSE_CACHE_VERSION = 1
+
+# Cap for the exponential cooldown of a rate-limited key when the response
+# carries no Retry-After
+_MAX_BACKOFF_SECONDS = 60
+# Attempts beyond one per key, so a call that finds every key rate limited
+# waits out a cooldown instead of failing straight away
+_RATE_LIMIT_EXTRA_ATTEMPTS = 3
+
+
+class RateLimitedError(requests.RequestException):
+    """Every attempt was rate limited (HTTP 429); the request can be retried later."""
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@lru_cache(maxsize=4)
+def _ids_json(all_topic_ids: tuple) -> str:
+    """JSON for all_topic_ids; a batch run passes the same list on every call."""
+    return _dumps(list(all_topic_ids))
+
+
+class _ResponseCache:
+    """SQLite store of validated Gemini responses keyed by request hash."""
+    
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Args:
+            path: SQLite file to keep responses in; created if missing
+            ttl: Seconds a response stays usable, or None to keep it forever
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl = ttl
+        # Shared by the client's worker threads, one statement at a time
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            )
+        """)
+        self._conn.commit()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Response cache read failed: {e}")
+            return None
+        if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+            return None
+        return json.loads(row[0])
+    
+    def put(self, key: str, content: Dict[str, Any]) -> None:
+        """Store a validated response under key."""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, payload, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(content), int(time.time()))
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Response cache write failed: {e}")
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
 
 class GeminiClient:
     """Client for Gemini 2.5 Flash API with structured output support."""
     
-    def __init__(self, api_keys: List[str] = None):
+    def __init__(self, api_keys: List[str] = None, session: Optional[requests.Session] = None,
+                 cache_path: Optional[str] = None, cache_ttl: Optional[float] = None):
         """Initialize the Gemini client.
         
         Args:
             api_keys: List of Google AI API keys for rotation. If None, will try to get from config or env var.
+            session: Optional shared HTTP session. Keep-alive connections in its pool are
+                reused across calls so each request skips the TCP/TLS handshake.
+            cache_path: SQLite file for cached responses (e.g. DEFAULT_RESPONSE_CACHE_PATH),
+                or None to always call the API
+            cache_ttl: Seconds a cached response is reused, or None for no expiry
         """
         if api_keys:
             self.api_keys = api_keys
@@ -32,36 +164,104 @@ class GeminiClient:
                 from config import API_KEYS
                 self.api_keys = API_KEYS
             except ImportError:
+                self.api_keys = []
+            if not self.api_keys:
                 # Fall back to environment variable
                 env_key = os.getenv('GOOGLE_AI_API_KEY')
                 if env_key:
                     self.api_keys = [env_key]
                 else:
-                    raise ValueError("API keys required. Set API_KEYS in config.py or GOOGLE_AI_API_KEY env var.")
+                    raise ValueError("API keys required. Set GEMINI_API_KEYS (see config.py) or GOOGLE_AI_API_KEY env var.")
         
         if not self.api_keys:
             raise ValueError("At least one API key required.")
         
-        # Shuffle keys so concurrent workers distribute load fairly
+        # Shuffle keys so concurrent workers distribute load fairly. Keys are
+        # handed out round-robin; any number of threads may share one.
         shuffled_keys = self.api_keys[:]
         random.shuffle(shuffled_keys)
-        self._key_queue: SimpleQueue[str] = SimpleQueue()
-        for key in shuffled_keys:
-            self._key_queue.put(key)
+        self._key_iter = itertools.cycle(shuffled_keys)
+        self._key_lock = threading.Lock()
+        # time.monotonic() before which a rate-limited key is skipped
+        self._key_available_at: Dict[str, float] = {}
         self.base_url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-flash-latest:generateContent"
         # self.base_url = "https://aiplatform.googleapis.com/v1/publishers/google/models/gemini-flash-latest:generateContent"
 
+        # Long-lived HTTP session; only close it on shutdown if we created it
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            # Callers typically run one worker per API key; size the pool to
+            # keep all of their connections alive rather than the default 10
+            pool_size = max(len(self.api_keys), 10)
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0))
+        self._session = session
+
         # Load the JSON schema for validation
         self.schema = self._load_schema()
+        
+        # Checked and compiled once; jsonschema.validate() would re-check
+        # the schema itself on every response
+        validator_class = validator_for(self.schema)
+        validator_class.check_schema(self.schema)
+        self._validator = validator_class(self.schema)
+        
+        # Request parts that are the same for every call, built once
+        self._generation_config = {
+            "responseMimeType": "application/json",
+            "temperature": 0.2,
+            "topP": 0.9,
+            "responseSchema": self.schema
+        }
+        self._system_instruction = {
+            "parts": [{"text": self._get_system_instruction()}]
+        }
+        # Serialized constant half of every response cache key
+        self._cache_key_prefix = json.dumps({
+            "version": _RESPONSE_CACHE_VERSION,
+            "system": self._system_instruction,
+            "generation": self._generation_config,
+        }, sort_keys=True).encode()
+        
+        self._cache = _ResponseCache(cache_path, cache_ttl) if cache_path else None
+    
+    def close(self):
+        """Close the underlying HTTP session if this client owns it, and the response cache."""
+        if self._owns_session:
+            self._session.close()
+        if self._cache is not None:
+            self._cache.close()
     
     @contextmanager
     def _acquire_api_key(self):
-        """Context manager that yields a temporarily reserved API key."""
-        api_key = self._key_queue.get()
-        try:
-            yield api_key
-        finally:
-            self._key_queue.put(api_key)
+        """
+        Context manager that yields the next API key in the rotation.
+        
+        Keys cooling down after a 429 are skipped; when every key is, this
+        waits for the one that becomes available first.
+        """
+        with self._key_lock:
+            now = time.monotonic()
+            for _ in range(len(self.api_keys)):
+                api_key = next(self._key_iter)
+                if self._key_available_at.get(api_key, 0.0) <= now:
+                    wait = 0.0
+                    break
+            else:
+                api_key = min(self.api_keys, key=lambda k: self._key_available_at.get(k, 0.0))
+                wait = self._key_available_at[api_key] - now
+        if wait > 0:
+            time.sleep(wait)
+        yield api_key
+    
+    def _cool_down_api_key(self, api_key: str, response: requests.Response, attempt: int) -> float:
+        """Park a rate-limited key for Retry-After, or an exponential backoff with jitter."""
+        backoff = _parse_retry_after(response.headers.get("Retry-After"))
+        if backoff is None:
+            backoff = min(_MAX_BACKOFF_SECONDS, 2 ** attempt + random.uniform(0, 1))
+        with self._key_lock:
+            self._key_available_at[api_key] = time.monotonic() + backoff
+        return backoff
     
     @staticmethod
     def _get_headers(api_key: str) -> Dict[str, str]:
@@ -194,8 +394,8 @@ The cleaned title should be professional, search-friendly, and reflect the actua
     def _build_user_prompt(self, topics: List[Dict[str, Any]], all_topic_ids: List[int], 
                           created_date: str, updated_date: str) -> str:
         """Build the user prompt with topic data."""
-        topics_json = json.dumps(topics)
-        all_ids_json = json.dumps(all_topic_ids)
+        topics_json = _dumps(topics)
+        all_ids_json = _ids_json(tuple(all_topic_ids))
         
         return f"""You will receive:
         - `topics`: a list (1–5) of {{id, title}} pairs (titles may contain numbering, markdown, or formatting)
@@ -250,54 +450,68 @@ updated_date: "{updated_date}" """
                 "role": "user",
                 "parts": [{"text": self._build_user_prompt(topics, all_topic_ids, created_date, updated_date)}]
             }],
-            "generationConfig": {
-                "responseMimeType": "application/json",
-                "temperature": 0.2,
-                "topP": 0.9,
-                "responseSchema": self.schema
-            },
-            "systemInstruction": {
-                "parts": [{"text": self._get_system_instruction()}]
-            }
+            "generationConfig": self._generation_config,
+            "systemInstruction": self._system_instruction
         }
         
-        # Make API call with retry logic for rate limiting
+        # The dates are only echoed back, so they are left out of the key
+        # and filled in on a cache hit
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._response_cache_key(topics, all_topic_ids)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                for topic in cached['topics']:
+                    topic['created_date'] = created_date
+                    topic['updated_date'] = updated_date
+                return self._extract_topics(cached)
+        
+        # Make API call with retry logic. Failed requests get one attempt per
+        # key; 429s are counted separately and get a few more, so a cooldown
+        # can be waited out
         max_retries = len(self.api_keys)
+        max_rate_limited = len(self.api_keys) + _RATE_LIMIT_EXTRA_ATTEMPTS
+        failed_attempts = 0
+        rate_limited_attempts = 0
         last_error = None
         
-        for attempt in range(max_retries):
+        while True:
             with self._acquire_api_key() as api_key:
                 try:
-                    response = requests.post(
+                    response = self._session.post(
                         f"{self.base_url}?key={api_key}",
                         headers=self._get_headers(api_key),
-                        json=payload,
+                        data=_dumps_bytes(payload),
                         timeout=300
                     )
                     
                     if response.ok:
                         break
                     elif response.status_code == 429:  # Rate limited
-                        print("Rate limited, rotating API key... %s", api_key)
-                        if attempt < max_retries - 1:
+                        backoff = self._cool_down_api_key(api_key, response, rate_limited_attempts)
+                        rate_limited_attempts += 1
+                        print(f"Rate limited, cooling key down for {backoff:.1f}s and rotating...")
+                        if rate_limited_attempts < max_rate_limited:
                             continue
+                        break
                     else:
                         raise requests.RequestException(f"API call failed: {response.status_code} - {response.text}")
                         
                 except requests.RequestException as e:
                     last_error = e
-                    if attempt < max_retries - 1:
+                    failed_attempts += 1
+                    if failed_attempts < max_retries:
                         print("Request failed, rotating API key... %s", api_key)
                         print(e)
                         continue
                     else:
                         raise last_error
         
-        if not response.ok:
-            raise requests.RequestException(f"API call failed after {max_retries} attempts: {response.status_code} - {response.text}")
+        if response.status_code == 429:
+            raise RateLimitedError(f"API call rate limited after {rate_limited_attempts} attempts: {response.text}")
         
         # Parse response
-        result = response.json()
+        result = _loads(response.content)
         
         if 'candidates' not in result or not result['candidates']:
             raise ValueError("No candidates in response")
@@ -305,17 +519,29 @@ updated_date: "{updated_date}" """
         content = result['candidates'][0]['content']['parts'][0]['text']
         
         try:
-            parsed_content = json.loads(content)
+            parsed_content = _loads(content)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in response: {e}")
         
-        # Validate against schema
-        try:
-            validate(parsed_content, self.schema)
-        except ValidationError as e:
-            raise ValidationError(f"Response validation failed: {e}")
+        # Validate against schema, reporting the same error validate() would
+        error = best_match(self._validator.iter_errors(parsed_content))
+        if error is not None:
+            raise ValidationError(f"Response validation failed: {error}")
         
-        # Extract topics from the response
+        topics = self._extract_topics(parsed_content)
+        if cache_key is not None:
+            self._cache.put(cache_key, parsed_content)
+        return topics
+    
+    def _response_cache_key(self, topics: List[Dict[str, Any]], all_topic_ids: List[int]) -> str:
+        """Hash everything that shapes the response except the dates."""
+        key = hashlib.sha256(self._cache_key_prefix)
+        key.update(self._build_user_prompt(topics, all_topic_ids, "", "").encode())
+        return key.hexdigest()
+    
+    @staticmethod
+    def _extract_topics(parsed_content: Dict[str, Any]) -> Union[Dict, List[Dict]]:
+        """Extract topics from a validated response."""
         if 'topics' in parsed_content:
             topics = parsed_content['topics']
             # Return single topic if only one, otherwise return list
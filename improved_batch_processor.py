@@ -11,9 +11,12 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import argparse
+import itertools
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from gemini_client import GeminiClient
+from gemini_client import GeminiClient, DEFAULT_RESPONSE_CACHE_PATH
 from improved_unified_database import improved_unified_db
 
 
@@ -22,10 +25,26 @@ class ImprovedTopicBatchProcessor:
     
     def __init__(self, api_keys: List[str] = None, output_dir: str = "output"):
         """Initialize the improved batch processor."""
-        self.client = GeminiClient(api_keys)
+        # Retries regenerate titles that were already paid for, so this
+        # processor reuses cached responses
+        self.client = GeminiClient(api_keys, cache_path=DEFAULT_RESPONSE_CACHE_PATH)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.db = improved_unified_db
+        # MAX(id) is read once; later IDs come from this counter, which
+        # workers share under _id_lock
+        self._id_lock = threading.Lock()
+        self._next_id_counter = itertools.count(self._query_max_topic_id() + 1)
+    
+    def close(self):
+        """Close the Gemini client and its response cache."""
+        self.client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def process_topics_with_consistency(self, topics_input: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -45,102 +64,131 @@ class ImprovedTopicBatchProcessor:
             'results': []
         }
         
-        # Step 1: Add all topics to topic_status as 'pending'
-        topic_status_mappings = []
+        # Step 1: Add all topics to topic_status as 'pending', in one commit
+        valid_inputs = []
         for topic_input in topics_input:
-            original_title = topic_input.get('title', '')
-            if not original_title:
+            if not topic_input.get('title', ''):
                 print(f"Skipping empty title")
                 stats['skipped'] += 1
                 continue
-                
-            # Add to topic_status table
-            topic_status_id = self.db.add_topic_for_processing(original_title)
-            if topic_status_id:
-                topic_status_mappings.append({
-                    'topic_status_id': topic_status_id,
-                    'original_title': original_title,
-                    'suggested_id': topic_input.get('id')  # User's suggested ID
-                })
-                print(f"✅ Added '{original_title}' with status ID: {topic_status_id}")
-            else:
-                print(f"❌ Failed to add '{original_title}' to processing queue")
-                stats['failed'] += 1
+            valid_inputs.append(topic_input)
         
-        # Step 2: Process each topic while carrying the topic_status_id
+        topic_status_mappings = []
+        if valid_inputs:
+            topic_status_ids = self.db.add_topics_for_processing_bulk(
+                [topic_input['title'] for topic_input in valid_inputs]
+            )
+            for topic_input, topic_status_id in zip(valid_inputs, topic_status_ids):
+                original_title = topic_input['title']
+                if topic_status_id:
+                    topic_status_mappings.append({
+                        'topic_status_id': topic_status_id,
+                        'original_title': original_title,
+                        'suggested_id': topic_input.get('id')  # User's suggested ID
+                    })
+                    print(f"✅ Added '{original_title}' with status ID: {topic_status_id}")
+                else:
+                    print(f"❌ Failed to add '{original_title}' to processing queue")
+                    stats['failed'] += 1
+        
+        # Step 2: Process topics concurrently, one worker per API key (the
+        # client hands each call its own key). IDs for topics without a
+        # suggested one are assigned up front so all_topic_ids is complete.
         for mapping in topic_status_mappings:
-            topic_status_id = mapping['topic_status_id']
-            original_title = mapping['original_title']
-            suggested_id = mapping['suggested_id']
-            
-            print(f"\n🔄 Processing: {original_title} (Status ID: {topic_status_id})")
-            
-            # Update status to 'processing'
-            self.db.update_topic_status_by_id(topic_status_id, 'processing')
-            
-            try:
-                # Generate content using Gemini
-                result = self._generate_single_topic_with_id(
-                    original_title=original_title,
-                    suggested_id=suggested_id,
-                    topic_status_id=topic_status_id
-                )
-                
-                if result['success']:
-                    # Update status to 'completed' and save the modified title
-                    generated_topic = result['topic']
-                    final_title = generated_topic.get('title', original_title)
-                    
-                    self.db.update_topic_status_by_id(
-                        topic_status_id=topic_status_id,
-                        status='completed',
-                        current_title=final_title
-                    )
-                    
-                    # Save to topics table with foreign key reference
-                    saved = self.db.save_generated_topic_with_status_id(
-                        topic_data=generated_topic,
-                        topic_status_id=topic_status_id
-                    )
-                    
-                    if saved:
-                        print(f"✅ Successfully processed and saved: {final_title}")
+            if not mapping['suggested_id']:
+                mapping['suggested_id'] = self._get_next_available_id()
+        all_topic_ids = [mapping['suggested_id'] for mapping in topic_status_mappings]
+        
+        if topic_status_mappings:
+            # Update status to 'processing' for the whole run at once
+            self.db.update_topic_status_by_ids(
+                [mapping['topic_status_id'] for mapping in topic_status_mappings], 'processing'
+            )
+            with ThreadPoolExecutor(max_workers=len(self.client.api_keys)) as executor:
+                futures = [
+                    executor.submit(self._process_mapping, mapping, all_topic_ids)
+                    for mapping in topic_status_mappings
+                ]
+                # Tallied here on the calling thread, in input order
+                for future in futures:
+                    result = future.result()
+                    if result['status'] == 'completed':
                         stats['processed'] += 1
-                        stats['results'].append({
-                            'topic_status_id': topic_status_id,
-                            'original_title': original_title,
-                            'final_title': final_title,
-                            'status': 'completed'
-                        })
                     else:
-                        raise Exception("Failed to save generated topic")
-                        
-                else:
-                    raise Exception(result.get('error', 'Unknown generation error'))
-                    
-            except Exception as e:
-                error_msg = str(e)
-                print(f"❌ Failed to process '{original_title}': {error_msg}")
+                        stats['failed'] += 1
+                    stats['results'].append(result)
+        
+        return stats
+    
+    def _process_mapping(self, mapping: Dict[str, Any], all_topic_ids: List[int]) -> Dict[str, Any]:
+        """Generate and save one topic, carrying its topic_status_id throughout."""
+        topic_status_id = mapping['topic_status_id']
+        original_title = mapping['original_title']
+        suggested_id = mapping['suggested_id']
+        
+        print(f"\n🔄 Processing: {original_title} (Status ID: {topic_status_id})")
+        
+        try:
+            # Generate content using Gemini
+            result = self._generate_single_topic_with_id(
+                original_title=original_title,
+                suggested_id=suggested_id,
+                topic_status_id=topic_status_id,
+                all_topic_ids=all_topic_ids
+            )
+            
+            if result['success']:
+                # Update status to 'completed' and save the modified title
+                generated_topic = result['topic']
+                final_title = generated_topic.get('title', original_title)
                 
-                # Update status to 'failed' with error message
                 self.db.update_topic_status_by_id(
                     topic_status_id=topic_status_id,
-                    status='failed',
-                    error_message=error_msg
+                    status='completed',
+                    current_title=final_title
                 )
                 
-                stats['failed'] += 1
-                stats['results'].append({
-                    'topic_status_id': topic_status_id,
-                    'original_title': original_title,
-                    'status': 'failed',
-                    'error': error_msg
-                })
-        
-        return stats
+                # Save to topics table with foreign key reference
+                saved = self.db.save_generated_topic_with_status_id(
+                    topic_data=generated_topic,
+                    topic_status_id=topic_status_id
+                )
+                
+                if saved:
+                    print(f"✅ Successfully processed and saved: {final_title}")
+                    return {
+                        'topic_status_id': topic_status_id,
+                        'original_title': original_title,
+                        'final_title': final_title,
+                        'status': 'completed'
+                    }
+                else:
+                    raise Exception("Failed to save generated topic")
+                    
+            else:
+                raise Exception(result.get('error', 'Unknown generation error'))
+                
+        except Exception as e:
+            error_msg = str(e)
+            print(f"❌ Failed to process '{original_title}': {error_msg}")
+            
+            # Update status to 'failed' with error message
+            self.db.update_topic_status_by_id(
+                topic_status_id=topic_status_id,
+                status='failed',
+                error_message=error_msg
+            )
+            
+            return {
+                'topic_status_id': topic_status_id,
+                'original_title': original_title,
+                'status': 'failed',
+                'error': error_msg
+            }
     
     def _generate_single_topic_with_id(self, original_title: str, suggested_id: Optional[int], 
-                                     topic_status_id: int) -> Dict[str, Any]:
+                                     topic_status_id: int,
+                                     all_topic_ids: Optional[List[int]] = None) -> Dict[str, Any]:
         """Generate a single topic while maintaining ID references."""
         try:
             # Create topic with suggested ID or auto-generate
@@ -150,7 +198,10 @@ class ImprovedTopicBatchProcessor:
             topics = self.client.generate_topics([{
                 'id': topic_id,
                 'title': original_title
-            }])
+            }], all_topic_ids or [topic_id])
+            # A single generated topic comes back as a bare dict
+            if isinstance(topics, dict):
+                topics = [topics]
             
             if topics and len(topics) > 0:
                 generated_topic = topics[0]
@@ -177,14 +228,18 @@ class ImprovedTopicBatchProcessor:
             }
     
     def _get_next_available_id(self) -> int:
-        """Get next available ID from topics table."""
+        """Get next available topic ID without a database round-trip."""
+        with self._id_lock:
+            return next(self._next_id_counter)
+    
+    def _query_max_topic_id(self) -> int:
+        """Get the highest ID in the topics table, or 0 when it is empty."""
         conn = self.db.get_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT MAX(id) FROM topics")
             result = cursor.fetchone()
-            max_id = result[0] if result[0] is not None else 0
-            return max_id + 1
+            return result[0] if result[0] is not None else 0
         finally:
             conn.close()
     
@@ -267,34 +322,35 @@ def main():
         print("Warning: Could not import API_KEYS from config.py")
         processor = ImprovedTopicBatchProcessor(output_dir=args.output_dir)
     
-    if args.status:
-        # Show processing status
-        stats = processor.get_processing_status()
-        print("\n📊 Processing Statistics:")
-        print(f"Total Topics: {stats['total_topics']}")
-        print(f"Completed: {stats['completed']}")
-        print(f"Failed: {stats['failed']}")
-        print(f"Processing: {stats['processing']}")
-        print(f"Pending: {stats['pending']}")
-        print(f"Completion Rate: {stats['completion_rate']}%")
-        return
+    with processor:
+        if args.status:
+            # Show processing status
+            stats = processor.get_processing_status()
+            print("\n📊 Processing Statistics:")
+            print(f"Total Topics: {stats['total_topics']}")
+            print(f"Completed: {stats['completed']}")
+            print(f"Failed: {stats['failed']}")
+            print(f"Processing: {stats['processing']}")
+            print(f"Pending: {stats['pending']}")
+            print(f"Completion Rate: {stats['completion_rate']}%")
+            return
     
-    if args.retry_failed:
-        # Retry failed topics
-        print("🔄 Retrying failed topics...")
-        result = processor.retry_failed_topics()
-        print(f"Retried: {result.get('retried', 0)} topics")
-        return
+        if args.retry_failed:
+            # Retry failed topics
+            print("🔄 Retrying failed topics...")
+            result = processor.retry_failed_topics()
+            print(f"Retried: {result.get('retried', 0)} topics")
+            return
     
-    # Process topics from file
-    print(f"🚀 Processing topics from: {args.topics_file}")
-    result = processor.process_from_file(args.topics_file)
+        # Process topics from file
+        print(f"🚀 Processing topics from: {args.topics_file}")
+        result = processor.process_from_file(args.topics_file)
     
-    print(f"\n📊 Processing Complete!")
-    print(f"Total: {result['total']}")
-    print(f"Processed: {result['processed']}")
-    print(f"Failed: {result['failed']}")
-    print(f"Skipped: {result['skipped']}")
+        print(f"\n📊 Processing Complete!")
+        print(f"Total: {result['total']}")
+        print(f"Processed: {result['processed']}")
+        print(f"Failed: {result['failed']}")
+        print(f"Skipped: {result['skipped']}")
 
 
 if __name__ == "__main__":
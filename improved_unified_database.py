@@ -28,6 +28,10 @@ class ImprovedUnifiedDatabase:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
+        # WAL is stored in the database file, so setting it once here covers
+        # every later connection
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Improved topic_status table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS topic_status (
@@ -138,7 +142,13 @@ class ImprovedUnifiedDatabase:
     
     def get_connection(self):
         """Get database connection."""
-        return sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        # Safe under WAL and avoids an fsync on every commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # INSERT OR REPLACE must fire the DELETE trigger for the replaced row
+        # so the topics_fts index kept by database.py stays in sync
+        conn.execute("PRAGMA recursive_triggers=ON")
+        return conn
     
     # ===== IMPROVED TOPIC STATUS MANAGEMENT =====
     
@@ -164,6 +174,45 @@ class ImprovedUnifiedDatabase:
         finally:
             conn.close()
     
+    def add_topics_for_processing_bulk(self, original_titles: List[str]) -> List[Optional[int]]:
+        """
+        Add several topics for processing under one commit.
+        
+        Returns their IDs in order, with None for each title that could not
+        be added (e.g. one already in topic_status under a UNIQUE constraint).
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            # One transaction for the run; a savepoint per row lets a failing
+            # title roll back on its own
+            cursor.execute("BEGIN")
+            topic_status_ids = []
+            for original_title in original_titles:
+                cursor.execute("SAVEPOINT add_topic")
+                try:
+                    cursor.execute("""
+                        INSERT INTO topic_status (original_title, status)
+                        VALUES (?, 'pending')
+                    """, (original_title,))
+                except sqlite3.Error as e:
+                    cursor.execute("ROLLBACK TO add_topic")
+                    print(f"Error adding topic for processing: {e}")
+                    topic_status_ids.append(None)
+                else:
+                    topic_status_ids.append(cursor.lastrowid)
+                cursor.execute("RELEASE add_topic")
+            conn.commit()
+            return topic_status_ids
+            
+        except Exception as e:
+            conn.rollback()
+            print(f"Error adding topics for processing: {e}")
+            return [None] * len(original_titles)
+        finally:
+            conn.close()
+    
     def update_topic_status_by_id(self, topic_status_id: int, status: str, 
                                  current_title: str = None, error_message: str = None) -> bool:
         """Update topic status by ID instead of title."""
@@ -207,6 +256,41 @@ class ImprovedUnifiedDatabase:
         finally:
             conn.close()
     
+    def update_topic_status_by_ids(self, topic_status_ids: List[int], status: str) -> int:
+        """Set the status of several topics in one UPDATE and return the number updated."""
+        if not topic_status_ids:
+            return 0
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            update_fields = ["status = ?", "updated_at = CURRENT_TIMESTAMP"]
+            if status == 'processing':
+                update_fields.append("processing_started_at = CURRENT_TIMESTAMP")
+            elif status in ['completed', 'failed']:
+                update_fields.append("processing_completed_at = CURRENT_TIMESTAMP")
+            
+            # Chunked to stay under SQLite's bound-parameter limit
+            updated = 0
+            for start in range(0, len(topic_status_ids), 500):
+                chunk = topic_status_ids[start:start + 500]
+                cursor.execute(f"""
+                    UPDATE topic_status 
+                    SET {', '.join(update_fields)}
+                    WHERE id IN ({','.join('?' * len(chunk))})
+                """, [status, *chunk])
+                updated += cursor.rowcount
+            conn.commit()
+            
+            return updated
+            
+        except Exception as e:
+            print(f"Error updating topic statuses: {e}")
+            return 0
+        finally:
+            conn.close()
+    
     def get_pending_topics_with_ids(self) -> List[Tuple[int, str]]:
         """Get all pending topics with their IDs."""
         conn = self.get_connection()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Regression test for the topics_fts search index.
+Topics re-saved through UnifiedDatabase (INSERT OR REPLACE on the shared
+unified.db) must not leave stale entries behind for TopicsDatabase searches.
+"""
+
+import os
+import tempfile
+
+from database import TopicsDatabase
+from unified_database import UnifiedDatabase
+
+
+def make_topic(topic_id, title):
+    """Build a minimal topic accepted by both database classes."""
+    return {
+        'id': topic_id,
+        'title': title,
+        'description': f'{title} explained',
+        'category': 'distributed-systems',
+        'subcategory': 'storage',
+        'company': 'Acme',
+        'technologies': ['python'],
+        'complexity_level': 'intermediate',
+        'tags': [],
+        'related_topics': [],
+        'metrics': {},
+        'implementation_details': {},
+        'learning_objectives': [],
+        'difficulty': 5,
+        'estimated_read_time': '10 minutes',
+        'prerequisites': [],
+        'created_date': '2025-01-01',
+        'updated_date': '2025-01-01',
+    }
+
+
+def test_replace_through_unified_database():
+    """Re-save a topic through UnifiedDatabase and search it through TopicsDatabase."""
+
+    print("🧪 Testing topics_fts sync across database classes")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "unified.db")
+
+        # unified.db is created by UnifiedDatabase; TopicsDatabase adds the
+        # FTS index and its triggers on top
+        unified_db = UnifiedDatabase(db_path)
+        topics_db = TopicsDatabase(db_path)
+
+        topics_db.save_topic(make_topic(1, "Kafka Internals"))
+        unified_db.save_topic(make_topic(1, "Redis Internals"))
+
+        stale = [t['title'] for t in topics_db.search_topics("Kafka")]
+        stale += [t['title'] for t in topics_db.get_topics_paginated(search="Kafka")]
+        found = [t['title'] for t in topics_db.search_topics("Redis")]
+
+        print(f"   Search 'Kafka': {stale}")
+        print(f"   Search 'Redis': {found}")
+
+        unified_db.close_connections()
+        topics_db.close()
+
+    success = not stale and found == ["Redis Internals"]
+    print(f"   {'✅' if success else '❌'} Replaced topic {'is' if success else 'is NOT'} re-indexed")
+    return success
+
+
+def main():
+    """Run the FTS sync test."""
+    success = test_replace_through_unified_database()
+
+    if success:
+        print("\n🎉 topics_fts stays in sync with writes from UnifiedDatabase.")
+    else:
+        print("\n❌ topics_fts is stale after a write from UnifiedDatabase.")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
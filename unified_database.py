@@ -11,19 +11,48 @@ import sqlite3
 import json
 import os
 import hashlib
+import inspect
 import logging
 import threading
 import time
 import random
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from functools import wraps
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Set after a commit that adds 'pending' topics so an in-process worker can
+# wake immediately instead of waiting out its poll interval.
+pending_topic_added = threading.Event()
+
+# Per-connection settings, applied to every new connection in one script.
+# WAL allows multiple readers + one writer; synchronous=NORMAL is still safe
+# with it. The 256MB mmap lets reads of a cached database skip read() calls.
+# recursive_triggers makes INSERT OR REPLACE fire the DELETE trigger for the
+# row it replaces, which keeps database.py's topics_fts index in sync.
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA wal_autocheckpoint=1000;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA busy_timeout=30000;
+    PRAGMA recursive_triggers=ON;
+"""
+
+# Bound on "?" placeholders per IN (...) query; older SQLite builds cap a
+# statement at 999 variables
+_IN_CHUNK_SIZE = 500
+
+# Dashboard stats are polled by every page load and client; a result is
+# reused for this many seconds, or until this instance commits a write
+_STATS_CACHE_TTL = 0.5
+
 
 def db_operation(commit=True, max_retries=10):
     """
@@ -40,21 +69,59 @@ def db_operation(commit=True, max_retries=10):
             return cursor.fetchone()
     """
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                # The body is awaited here, so it runs and commits under the
+                # write lock like any other write. These bodies never await,
+                # so the lock is not held across a suspension.
+                if getattr(self._local, 'in_transaction', False):
+                    return await func(self, self._write_conn.cursor(), *args, **kwargs)
+                with self._write_lock if commit else nullcontext():
+                    conn = self._get_write_connection() if commit else self._get_connection()
+                    try:
+                        result = await func(self, conn.cursor(), *args, **kwargs)
+                        if commit:
+                            conn.commit()
+                            self._write_count += 1
+                    except Exception:
+                        if commit:
+                            conn.rollback()
+                        raise
+                return result
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            # Inside transaction() the outer block owns commit/rollback and
+            # lock retries, so the operation just runs on its cursor
+            if getattr(self._local, 'in_transaction', False):
+                return func(self, self._write_conn.cursor(), *args, **kwargs)
+            
             last_exception = None
             
             for attempt in range(max_retries):
-                conn = self._get_connection()
-                cursor = conn.cursor()
                 try:
-                    result = func(self, cursor, *args, **kwargs)
-                    if commit:
-                        conn.commit()
+                    # Writers in this process take turns on the one write
+                    # connection instead of contending for SQLite's lock;
+                    # reads run concurrently on their thread's connection
+                    with self._write_lock if commit else nullcontext():
+                        conn = self._get_write_connection() if commit else self._get_connection()
+                        try:
+                            result = func(self, conn.cursor(), *args, **kwargs)
+                            if commit:
+                                conn.commit()
+                                self._write_count += 1
+                        except Exception:
+                            if commit:
+                                conn.rollback()
+                            raise
+                    if commit and getattr(self._local, 'pending_added', False):
+                        self._local.pending_added = False
+                        pending_topic_added.set()
                     return result
                 except sqlite3.OperationalError as e:
-                    if commit:
-                        conn.rollback()
+                    self._local.pending_added = False
                     
                     # Check if it's a database locked error
                     if 'locked' in str(e).lower():
@@ -71,8 +138,7 @@ def db_operation(commit=True, max_retries=10):
                         logger.error(f"Database error in {func.__name__}: {e}", exc_info=True)
                         raise
                 except Exception as e:
-                    if commit:
-                        conn.rollback()
+                    self._local.pending_added = False
                     logger.error(f"Database error in {func.__name__}: {e}", exc_info=True)
                     raise
             
@@ -83,6 +149,32 @@ def db_operation(commit=True, max_retries=10):
     return decorator
 
 
+def cached_result(func):
+    """
+    Decorator reusing a read-only method's last result per argument set.
+    
+    A result is served again for _STATS_CACHE_TTL seconds unless this
+    instance has committed a write since; the same object is returned,
+    so callers must not modify it.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        cached = self._result_cache.get(key)
+        if (cached is not None and cached[0] == self._write_count
+                and time.monotonic() - cached[1] < _STATS_CACHE_TTL):
+            return cached[2]
+        
+        # A write that commits while the query runs keeps the result uncached
+        write_count = self._write_count
+        started = time.monotonic()
+        result = func(self, *args, **kwargs)
+        if self._write_count == write_count:
+            self._result_cache[key] = (write_count, started, result)
+        return result
+    return wrapper
+
+
 class UnifiedDatabase:
     """
     Refactored unified SQLite database manager with improved performance and maintainability.
@@ -101,6 +193,14 @@ class UnifiedDatabase:
         
         # Thread-local storage for connections
         self._local = threading.local()
+        # Held by each writing @db_operation and transaction() block, so
+        # only one thread in the process writes at a time; reads don't take it
+        self._write_lock = threading.RLock()
+        # Shared by all threads for writes, and only used under _write_lock
+        self._write_conn = None
+        # Bumped on each commit; invalidates @cached_result entries
+        self._write_count = 0
+        self._result_cache = {}
         
         self._init_database()
         logger.info(f"Initialized UnifiedDatabase at {db_path}")
@@ -118,20 +218,27 @@ class UnifiedDatabase:
                 isolation_level='DEFERRED'  # Better concurrency
             )
             self._local.conn.row_factory = sqlite3.Row
-            # Enable WAL mode for better concurrency (allows multiple readers + one writer)
-            self._local.conn.execute("PRAGMA journal_mode=WAL")
-            # Optimize WAL and write performance
-            self._local.conn.execute("PRAGMA wal_autocheckpoint=1000")  # Checkpoint every 1000 pages
-            self._local.conn.execute("PRAGMA synchronous=NORMAL")      # Faster writes (safe with WAL)
-            self._local.conn.execute("PRAGMA cache_size=-64000")       # 64MB cache
-            self._local.conn.execute("PRAGMA temp_store=MEMORY")       # Temp tables in memory
+            self._local.conn.executescript(_CONNECTION_PRAGMAS)
             # Enable foreign keys
             self._local.conn.execute("PRAGMA foreign_keys = ON")
-            # Optimize for concurrent access
-            self._local.conn.execute("PRAGMA busy_timeout = 30000")  # 30 seconds
             logger.debug(f"Created new database connection for thread {threading.current_thread().name}")
         return self._local.conn
     
+    def _get_write_connection(self):
+        """Get or create the connection used for writes; hold _write_lock."""
+        if self._write_conn is None:
+            self._write_conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                timeout=30.0,
+                isolation_level='DEFERRED'
+            )
+            self._write_conn.row_factory = sqlite3.Row
+            self._write_conn.executescript(_CONNECTION_PRAGMAS)
+            self._write_conn.execute("PRAGMA foreign_keys = ON")
+            logger.debug("Created write connection")
+        return self._write_conn
+    
     def get_connection(self):
         """
         Get database connection (backward compatible).
@@ -145,12 +252,7 @@ class UnifiedDatabase:
         )
         conn.row_factory = sqlite3.Row
         # Enable WAL mode and optimizations for this connection too
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA wal_autocheckpoint=1000")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA cache_size=-64000")
-        conn.execute("PRAGMA temp_store=MEMORY")
-        conn.execute("PRAGMA busy_timeout = 30000")
+        conn.executescript(_CONNECTION_PRAGMAS)
         return conn
     
     @contextmanager
@@ -158,21 +260,45 @@ class UnifiedDatabase:
         """
         Context manager for explicit transaction management.
         
+        Takes the write lock up front (the process-wide _write_lock, then
+        BEGIN IMMEDIATE on the shared write connection) and defers the
+        commit of any @db_operation methods called inside the block, so a
+        run of writes shares one commit.
+        
         Usage:
             with db.transaction() as cursor:
                 cursor.execute("INSERT INTO ...")
-                cursor.execute("UPDATE ...")
+                db.save_topic(topic)
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        self._write_lock.acquire()
+        try:
+            conn = self._get_write_connection()
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+        except Exception:
+            self._write_lock.release()
+            raise
+        self._local.in_transaction = True
         try:
             yield cursor
             conn.commit()
+            self._write_count += 1
             logger.debug("Transaction committed successfully")
+            if getattr(self._local, 'pending_added', False):
+                self._local.pending_added = False
+                pending_topic_added.set()
         except Exception as e:
             conn.rollback()
+            self._local.pending_added = False
             logger.error(f"Transaction rolled back due to error: {e}", exc_info=True)
             raise
+        finally:
+            self._local.in_transaction = False
+            self._write_lock.release()
+    
+    def _mark_pending_added(self):
+        """Signal ``pending_topic_added`` once the current operation commits."""
+        self._local.pending_added = True
     
     def close_connections(self):
         """Close thread-local connection if it exists."""
@@ -309,10 +435,14 @@ class UnifiedDatabase:
             
             # Create indexes for better performance
             indexes = [
+                # Title lookups (get_topic_by_title, get_topics_by_titles)
+                "CREATE INDEX IF NOT EXISTS idx_topics_title ON topics(title)",
                 "CREATE INDEX IF NOT EXISTS idx_topics_category ON topics(category)",
                 "CREATE INDEX IF NOT EXISTS idx_topics_company ON topics(company)",
                 "CREATE INDEX IF NOT EXISTS idx_topics_complexity ON topics(complexity_level)",
                 "CREATE INDEX IF NOT EXISTS idx_topics_difficulty ON topics(difficulty)",
+                "CREATE INDEX IF NOT EXISTS idx_topics_created ON topics(created_date, id)",
+                "CREATE INDEX IF NOT EXISTS idx_topics_generated_at ON topics(generated_at)",
                 "CREATE INDEX IF NOT EXISTS idx_topic_status_status ON topic_status(status)",
                 "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)",
                 "CREATE INDEX IF NOT EXISTS idx_tasks_job_id ON tasks(job_id)",
@@ -326,14 +456,30 @@ class UnifiedDatabase:
             
             if 'title' in topic_status_columns:
                 indexes.append("CREATE INDEX IF NOT EXISTS idx_topic_status_title ON topic_status(title)")
+                # status = ? AND title = ? lookups (fix_processing_mismatch)
+                indexes.append("CREATE INDEX IF NOT EXISTS idx_topic_status_status_title ON topic_status(status, title)")
+                # Partial index holding only the 'processing' rows, newest
+                # last, for fix_processing_mismatch's ORDER BY created_at scan
+                indexes.append(
+                    "CREATE INDEX IF NOT EXISTS idx_topic_status_processing "
+                    "ON topic_status(created_at, title) WHERE status = 'processing'"
+                )
             if 'original_title' in topic_status_columns:
                 indexes.append("CREATE INDEX IF NOT EXISTS idx_topic_status_original_title ON topic_status(original_title)")
             if 'current_title' in topic_status_columns:
                 indexes.append("CREATE INDEX IF NOT EXISTS idx_topic_status_current_title ON topic_status(current_title)")
             
+            cursor.execute("SELECT count(*) FROM sqlite_master WHERE type = 'index'")
+            index_count = cursor.fetchone()[0]
             for index in indexes:
                 cursor.execute(index)
             
+            cursor.execute("SELECT count(*) FROM sqlite_master WHERE type = 'index'")
+            if cursor.fetchone()[0] != index_count:
+                # Refresh planner statistics so new indexes (the partial
+                # one in particular) get picked over a scan and sort
+                cursor.execute("ANALYZE")
+            
             logger.info("Database schema initialization complete")
     
     # ===== TOPIC MANAGEMENT METHODS =====
@@ -343,25 +489,24 @@ class UnifiedDatabase:
         if isinstance(field_value, (list, dict)):
             return json.dumps(field_value)
         elif isinstance(field_value, str):
-            try:
-                json.loads(field_value)
-                return field_value
-            except (json.JSONDecodeError, TypeError):
-                return field_value
+            # Stored as-is whether or not it is valid JSON, so skip re-parsing
+            # already-serialized payloads
+            return field_value
         else:
             return field_value or ""
     
-    @db_operation()
-    def save_topic(self, cursor, topic: Dict[str, Any], source: str = "web_batch") -> bool:
-        """Save a topic to the database."""
-        cursor.execute("""
+    _SAVE_TOPIC_SQL = """
             INSERT OR REPLACE INTO topics 
             (id, title, description, category, subcategory, company, technologies,
              complexity_level, tags, related_topics, metrics, implementation_details,
              learning_objectives, difficulty, estimated_read_time, prerequisites,
              created_date, updated_date, source)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        """
+    
+    def _topic_row(self, topic: Dict[str, Any], source: str) -> tuple:
+        """Build the _SAVE_TOPIC_SQL parameter tuple for a topic."""
+        return (
             topic.get('id'),
             topic.get('title', ''),
             topic.get('description', ''),
@@ -381,10 +526,22 @@ class UnifiedDatabase:
             topic.get('created_date', datetime.now().strftime("%Y-%m-%d")),
             topic.get('updated_date', datetime.now().strftime("%Y-%m-%d")),
             source
-        ))
+        )
+    
+    @db_operation()
+    def save_topic(self, cursor, topic: Dict[str, Any], source: str = "web_batch") -> bool:
+        """Save a topic to the database."""
+        cursor.execute(self._SAVE_TOPIC_SQL, self._topic_row(topic, source))
         logger.info(f"Saved topic {topic.get('id')}: {topic.get('title')}")
         return True
     
+    @db_operation()
+    def save_topics_bulk(self, cursor, topics: List[Dict[str, Any]], source: str = "web_batch") -> int:
+        """Save many topics with one executemany and a single commit."""
+        cursor.executemany(self._SAVE_TOPIC_SQL, [self._topic_row(topic, source) for topic in topics])
+        logger.info(f"Saved {len(topics)} topics in bulk")
+        return len(topics)
+    
     @db_operation()
     def get_topic_by_id(self, cursor, topic_id: int) -> Optional[Dict[str, Any]]:
         """Get a topic by ID."""
@@ -440,6 +597,38 @@ class UnifiedDatabase:
         logger.debug(f"Topic not found: {title}")
         return None
     
+    @db_operation(commit=False)
+    def get_topics_by_titles(self, cursor, titles: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk form of get_topic_by_title(): one query per chunk of titles.
+        
+        Returns:
+            Dict mapping each found title to the same row get_topic_by_title() returns
+        """
+        cursor.execute("PRAGMA table_info(topic_status)")
+        columns = {row[1] for row in cursor.fetchall()}
+        
+        if 'original_title' in columns:
+            join = "(t.title = ts.original_title OR t.title = ts.current_title)"
+        else:
+            join = "t.title = ts.title"
+        
+        titles = list(dict.fromkeys(title.strip() for title in titles))
+        found = {}
+        for start in range(0, len(titles), _IN_CHUNK_SIZE):
+            chunk = titles[start:start + _IN_CHUNK_SIZE]
+            cursor.execute(f"""
+                SELECT t.*, ts.status, ts.error_message, ts.created_at as status_created_at
+                FROM topics t
+                LEFT JOIN topic_status ts ON {join}
+                WHERE t.title IN ({','.join('?' * len(chunk))})
+            """, chunk)
+            for row in cursor.fetchall():
+                found.setdefault(row['title'], dict(row))
+        
+        logger.debug(f"Retrieved {len(found)} of {len(titles)} topics by title")
+        return found
+    
     @db_operation()
     def delete_topic(self, cursor, topic_id: int) -> bool:
         """Delete a topic by ID."""
@@ -483,6 +672,7 @@ class UnifiedDatabase:
             """, (original_title,))
         
         topic_status_id = cursor.lastrowid
+        self._mark_pending_added()
         logger.info(f"Added topic for processing: {original_title} (ID: {topic_status_id})")
         return topic_status_id
     
@@ -531,6 +721,55 @@ class UnifiedDatabase:
         
         return success
     
+    @db_operation()
+    def add_topics_for_processing_bulk(self, cursor, original_titles: List[str]) -> List[int]:
+        """
+        Bulk form of add_topic_for_processing(): every row is inserted under one commit.
+        
+        Returns:
+            Status IDs in the same order as original_titles
+        """
+        if not original_titles:
+            return []
+        
+        cursor.execute("PRAGMA table_info(topic_status)")
+        columns = {row[1] for row in cursor.fetchall()}
+        title_column = 'original_title' if 'original_title' in columns else 'title'
+        
+        # Inserted one statement at a time so lastrowid gives each ID; the
+        # cost that matters is the single commit, not the statements
+        insert_sql = f"INSERT INTO topic_status ({title_column}, status) VALUES (?, 'pending')"
+        topic_status_ids = []
+        for original_title in original_titles:
+            cursor.execute(insert_sql, (original_title,))
+            topic_status_ids.append(cursor.lastrowid)
+        
+        self._mark_pending_added()
+        logger.info(f"Added {len(topic_status_ids)} topics for processing")
+        return topic_status_ids
+    
+    @db_operation()
+    def update_topic_status_by_ids(self, cursor, topic_status_ids: List[int], status: str) -> int:
+        """
+        Bulk form of update_topic_status_by_id() for a plain status change.
+        
+        Returns:
+            Number of status rows updated
+        """
+        topic_status_ids = list(topic_status_ids)
+        updated = 0
+        for start in range(0, len(topic_status_ids), _IN_CHUNK_SIZE):
+            chunk = topic_status_ids[start:start + _IN_CHUNK_SIZE]
+            cursor.execute(f"""
+                UPDATE topic_status 
+                SET status = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id IN ({','.join('?' * len(chunk))})
+            """, [status, *chunk])
+            updated += cursor.rowcount
+        
+        logger.info(f"Updated {updated} topic statuses to {status}")
+        return updated
+    
     @db_operation(commit=False)
     def get_topic_status_by_title(self, cursor, title: str) -> Optional[Dict[str, Any]]:
         """Get topic_status record by title."""
@@ -566,9 +805,10 @@ class UnifiedDatabase:
         logger.debug(f"No topic status found for: {title}")
         return None
     
+    @cached_result
     @db_operation(commit=False)
     def get_topic_status_summary(self, cursor) -> Dict[str, Any]:
-        """Get summary of topic statuses."""
+        """Get summary of topic statuses (briefly cached, see cached_result)."""
         cursor.execute("""
             SELECT status, COUNT(*) as count
             FROM topic_status
@@ -772,8 +1012,75 @@ class UnifiedDatabase:
                            complexity: str = None, company: str = None,
                            tag: str = None, technology: str = None,
                            sort_by: str = "created_date", 
-                           sort_order: str = "desc") -> List[Dict[str, Any]]:
+                           sort_order: str = "desc",
+                           ids: List[int] = None) -> List[Dict[str, Any]]:
         """Get topics with pagination and filtering."""
+        return self._query_topics_page(cursor, limit, offset, search, category, subcategory,
+                                       status, complexity, company, tag, technology,
+                                       sort_by, sort_order, ids)
+    
+    @db_operation(commit=False)
+    def get_topics_page_with_count(self, cursor, limit: int = 20, offset: int = 0, 
+                                   search: str = None, category: str = None, 
+                                   subcategory: str = None, status: str = None, 
+                                   complexity: str = None, company: str = None,
+                                   tag: str = None, technology: str = None,
+                                   sort_by: str = "created_date", 
+                                   sort_order: str = "desc",
+                                   ids: List[int] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get a page of topics and the total number of matches in one query.
+        
+        The total comes from COUNT(*) OVER () on the page query, so the
+        filters are evaluated once instead of again by get_topics_count.
+        """
+        topics = self._query_topics_page(cursor, limit, offset, search, category, subcategory,
+                                         status, complexity, company, tag, technology,
+                                         sort_by, sort_order, ids, with_total=True)
+        if topics:
+            total = topics[0]['total_count']
+            for topic in topics:
+                del topic['total_count']
+        elif offset:
+            # Past the last page there are no rows to carry the total
+            total = self.get_topics_count(search=search, category=category, subcategory=subcategory,
+                                          status=status, complexity=complexity, company=company,
+                                          tag=tag, technology=technology, ids=ids)
+        else:
+            total = 0
+        return topics, total
+    
+    @db_operation(commit=False)
+    def get_topics_after(self, cursor, cursor_created_date: str = None, cursor_id: int = None,
+                         limit: int = 20, search: str = None, category: str = None,
+                         subcategory: str = None, status: str = None,
+                         complexity: str = None, company: str = None,
+                         tag: str = None, technology: str = None,
+                         ids: List[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get the page of topics that follows a keyset cursor, newest first.
+        
+        Pass the created_date and id of the last topic on the previous page,
+        or leave both as None for the first page. The query seeks straight
+        to the cursor in idx_topics_created instead of skipping OFFSET rows.
+        """
+        after = None
+        if cursor_created_date is not None and cursor_id is not None:
+            after = (cursor_created_date, cursor_id)
+        return self._query_topics_page(cursor, limit, 0, search, category, subcategory,
+                                       status, complexity, company, tag, technology,
+                                       "created_date", "desc", ids, after=after)
+    
+    def _query_topics_page(self, cursor, limit, offset, search, category, subcategory,
+                           status, complexity, company, tag, technology,
+                           sort_by, sort_order, ids, with_total=False,
+                           after=None) -> List[Dict[str, Any]]:
+        """
+        Run the paginated topics query, optionally adding a total_count column.
+        
+        When after is a (created_date, id) pair, only topics ordered after it
+        by created_date DESC, id DESC are returned.
+        """
         # Check schema to determine JOIN condition
         cursor.execute("PRAGMA table_info(topic_status)")
         columns = {row[1] for row in cursor.fetchall()}
@@ -817,6 +1124,14 @@ class UnifiedDatabase:
             where_conditions.append("topic_status.status = ?")
             params.append(status)
         
+        if ids:
+            where_conditions.append(f"topics.id IN ({','.join('?' * len(ids))})")
+            params.extend(ids)
+        
+        if after:
+            where_conditions.append("(topics.created_date, topics.id) < (?, ?)")
+            params.extend(after)
+        
         where_clause = ""
         if where_conditions:
             where_clause = "WHERE " + " AND ".join(where_conditions)
@@ -827,7 +1142,9 @@ class UnifiedDatabase:
             sort_by = "created_date"
         
         sort_direction = "ASC" if sort_order.lower() == "asc" else "DESC"
-        order_clause = f"ORDER BY topics.{sort_by} {sort_direction}"
+        # id breaks ties so pages (and keyset cursors) have a stable order
+        order_clause = f"ORDER BY topics.{sort_by} {sort_direction}, topics.id {sort_direction}"
+        total_column = ", COUNT(*) OVER () as total_count" if with_total else ""
         
         # Build query with correct JOIN based on schema
         if has_original_title:
@@ -839,6 +1156,7 @@ class UnifiedDatabase:
             SELECT topics.*, 
                    topic_status.status as processing_status, 
                    topic_status.error_message
+                   {total_column}
             FROM topics
             {join_condition}
             {where_clause}
@@ -858,7 +1176,8 @@ class UnifiedDatabase:
     def get_topics_count(self, cursor, search: str = None, category: str = None, 
                         subcategory: str = None, status: str = None, 
                         complexity: str = None, company: str = None,
-                        tag: str = None, technology: str = None) -> int:
+                        tag: str = None, technology: str = None,
+                        ids: List[int] = None) -> int:
         """Get total count of topics matching filters."""
         # Check schema to determine JOIN condition
         cursor.execute("PRAGMA table_info(topic_status)")
@@ -902,6 +1221,10 @@ class UnifiedDatabase:
             where_conditions.append("topic_status.status = ?")
             params.append(status)
         
+        if ids:
+            where_conditions.append(f"topics.id IN ({','.join('?' * len(ids))})")
+            params.extend(ids)
+        
         where_clause = ""
         if where_conditions:
             where_clause = "WHERE " + " AND ".join(where_conditions)
@@ -1039,6 +1362,8 @@ class UnifiedDatabase:
             """, topics)
             saved_count = len(topics)
         
+        if any(status == 'pending' for _, status, _ in topics):
+            self._mark_pending_added()
         logger.info(f"Batch saved {saved_count} topic statuses")
         return saved_count
     
@@ -1079,6 +1404,8 @@ class UnifiedDatabase:
                 VALUES (?, ?, ?, CURRENT_TIMESTAMP)
             """, (title, status, error_message))
         
+        if status == 'pending':
+            self._mark_pending_added()
         logger.info(f"Saved topic status for '{title}': {status}")
         return True
     
@@ -1092,9 +1419,10 @@ class UnifiedDatabase:
         
         return dict(row)
     
+    @cached_result
     @db_operation(commit=False)
     def get_topics_stats(self, cursor) -> Dict[str, Any]:
-        """Get comprehensive topic statistics."""
+        """Get comprehensive topic statistics (briefly cached, see cached_result)."""
         # Total topics
         cursor.execute("SELECT COUNT(*) as count FROM topics")
         total_topics = cursor.fetchone()['count']
@@ -1145,14 +1473,16 @@ class UnifiedDatabase:
         cursor.execute("SELECT AVG(difficulty) as avg FROM topics WHERE difficulty IS NOT NULL")
         avg_difficulty = cursor.fetchone()['avg'] or 0
         
-        # Daily stats (last 7 days)
+        # Daily stats (last 7 days). generated_at is a UTC CURRENT_TIMESTAMP,
+        # so the bound seeks idx_topics_generated_at and the day is its prefix
+        since = datetime.now(timezone.utc) - timedelta(days=7)
         cursor.execute("""
-            SELECT DATE(generated_at) as date, COUNT(*) as count
+            SELECT substr(generated_at, 1, 10) as date, COUNT(*) as count
             FROM topics
-            WHERE generated_at >= datetime('now', '-7 days')
-            GROUP BY DATE(generated_at)
+            WHERE generated_at >= ?
+            GROUP BY date
             ORDER BY date DESC
-        """)
+        """, (since.strftime('%Y-%m-%d %H:%M:%S'),))
         daily_stats = [{'date': row['date'], 'count': row['count']} for row in cursor.fetchall()]
         
         return {
@@ -41,6 +41,9 @@ def db_operation(commit=True):
         def wrapper(self, *args, **kwargs):
             conn = self._get_connection()
             cursor = conn.cursor()
+            # Inside transaction() the outer block owns commit/rollback
+            if getattr(self._local, 'in_transaction', False):
+                return func(self, cursor, *args, **kwargs)
             try:
                 result = func(self, cursor, *args, **kwargs)
                 if commit:
@@ -91,6 +94,9 @@ class UnifiedDatabase:
             self._local.conn.row_factory = sqlite3.Row
             # Enable foreign keys
             self._local.conn.execute("PRAGMA foreign_keys = ON")
+            # INSERT OR REPLACE must fire the DELETE trigger for the replaced
+            # row so the topics_fts index kept by database.py stays in sync
+            self._local.conn.execute("PRAGMA recursive_triggers=ON")
             logger.debug(f"Created new database connection for thread {threading.current_thread().name}")
         return self._local.conn
     
@@ -99,13 +105,19 @@ class UnifiedDatabase:
         """
         Context manager for explicit transaction management.
         
+        Takes the write lock up front (BEGIN IMMEDIATE) and defers the
+        commit of any @db_operation methods called inside the block, so a
+        run of writes shares one commit.
+        
         Usage:
             with db.transaction() as cursor:
                 cursor.execute("INSERT INTO ...")
-                cursor.execute("UPDATE ...")
+                db.save_topic(topic)
         """
         conn = self._get_connection()
         cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        self._local.in_transaction = True
         try:
             yield cursor
             conn.commit()
@@ -114,6 +126,8 @@ class UnifiedDatabase:
             conn.rollback()
             logger.error(f"Transaction rolled back due to error: {e}", exc_info=True)
             raise
+        finally:
+            self._local.in_transaction = False
     
     def close_connections(self):
         """Close thread-local connection if it exists."""
@@ -284,25 +298,24 @@ class UnifiedDatabase:
         if isinstance(field_value, (list, dict)):
             return json.dumps(field_value)
         elif isinstance(field_value, str):
-            try:
-                json.loads(field_value)
-                return field_value
-            except (json.JSONDecodeError, TypeError):
-                return field_value
+            # Stored as-is whether or not it is valid JSON, so skip re-parsing
+            # already-serialized payloads
+            return field_value
         else:
             return field_value or ""
     
-    @db_operation()
-    def save_topic(self, cursor, topic: Dict[str, Any], source: str = "web_batch") -> bool:
-        """Save a topic to the database."""
-        cursor.execute("""
+    _SAVE_TOPIC_SQL = """
             INSERT OR REPLACE INTO topics 
             (id, title, description, category, subcategory, company, technologies,
              complexity_level, tags, related_topics, metrics, implementation_details,
              learning_objectives, difficulty, estimated_read_time, prerequisites,
              created_date, updated_date, source)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        """
+    
+    def _topic_row(self, topic: Dict[str, Any], source: str) -> tuple:
+        """Build the _SAVE_TOPIC_SQL parameter tuple for a topic."""
+        return (
             topic.get('id'),
             topic.get('title', ''),
             topic.get('description', ''),
@@ -322,10 +335,22 @@ class UnifiedDatabase:
             topic.get('created_date', datetime.now().strftime("%Y-%m-%d")),
             topic.get('updated_date', datetime.now().strftime("%Y-%m-%d")),
             source
-        ))
+        )
+    
+    @db_operation()
+    def save_topic(self, cursor, topic: Dict[str, Any], source: str = "web_batch") -> bool:
+        """Save a topic to the database."""
+        cursor.execute(self._SAVE_TOPIC_SQL, self._topic_row(topic, source))
         logger.info(f"Saved topic {topic.get('id')}: {topic.get('title')}")
         return True
     
+    @db_operation()
+    def save_topics_bulk(self, cursor, topics: List[Dict[str, Any]], source: str = "web_batch") -> int:
+        """Save many topics with one executemany and a single commit."""
+        cursor.executemany(self._SAVE_TOPIC_SQL, [self._topic_row(topic, source) for topic in topics])
+        logger.info(f"Saved {len(topics)} topics in bulk")
+        return len(topics)
+    
     @db_operation()
     def get_topic_by_id(self, cursor, topic_id: int) -> Optional[Dict[str, Any]]:
         """Get a topic by ID."""